@@ -1,8 +1,49 @@
 """Pylint checker for MCP tool conventions."""
 
+from typing import TYPE_CHECKING
+
 from astroid import nodes
 from pylint.checkers import BaseChecker
 
+if TYPE_CHECKING:
+    from pylint.lint import PyLinter
+
+_DICT_NAMES = frozenset(("dict",))
+_LIST_NAMES = frozenset(("list",))
+
+# astroid node classes are matched by identity (``node.__class__ is nodes.X``)
+# rather than isinstance(); AsyncFunctionDef subclasses FunctionDef, so both are
+# listed wherever a function definition should match.
+_FUNCTION_NODES = frozenset({nodes.FunctionDef, nodes.AsyncFunctionDef})
+
+
+def _return_is_dict_literal(node: nodes.Return) -> bool:
+    """Check if a return statement returns a dict literal."""
+    return node.value.__class__ is nodes.Dict
+
+
+def _if_returns_dict_literal(node: nodes.If) -> bool:
+    """Check both branches of an if statement for dict literal returns."""
+    for child in node.body:
+        if _check_return_dict(child):
+            return True
+    for child in node.orelse:
+        if _check_return_dict(child):
+            return True
+    return False
+
+
+_CHECK_RETURN_DISPATCH = {
+    nodes.Return: _return_is_dict_literal,
+    nodes.If: _if_returns_dict_literal,
+}
+
+
+def _check_return_dict(node: nodes.NodeNG) -> bool:
+    """Recursively check if a node or its children return dict literals."""
+    handler = _CHECK_RETURN_DISPATCH.get(node.__class__)
+    return handler is not None and handler(node)
+
 
 class MCPToolChecker(BaseChecker):
     """Check that MCP tools follow architectural conventions."""
@@ -45,6 +86,10 @@ class MCPToolChecker(BaseChecker):
 
     def visit_functiondef(self, node: nodes.FunctionDef) -> None:
         """Check function definitions for MCP tool violations."""
+        # Every rule below is keyed on a decorator
+        if not node.decorators:
+            return
+
         # Check for simple field serializers and validators in models
         if self._has_field_serializer_decorator(node) and self._is_simple_delegation(node):
             self.add_message("simple-field-serializer", node=node, args=(node.name,))
@@ -73,25 +118,41 @@ class MCPToolChecker(BaseChecker):
         if self._returns_dict(node):
             self.add_message("mcp-dict-return", node=node, args=(node.name,))
 
-        # Check for nested function definitions
+        # Single pass over the body: nested functions, manual model construction,
+        # dict literal returns (including inside if/else) and from_gitlab listcomps
+        has_manual_construction = False
+        returns_dict_literal = False
+        has_from_gitlab_listcomp = False
         for child in node.body:
-            if isinstance(child, nodes.FunctionDef):
+            child_type = child.__class__
+            if child_type in _FUNCTION_NODES:
                 self.add_message(
                     "mcp-nested-function",
                     node=child,
                     args=(node.name, child.name)
                 )
-
-        # Check for manual model construction
-        if self._has_manual_construction(node):
+            elif child_type is nodes.Return:
+                value = child.value
+                value_type = value.__class__
+                if value_type is nodes.Dict:
+                    returns_dict_literal = True
+                elif value_type is nodes.Call:
+                    # Multiple keyword args to a constructor is likely manual field mapping
+                    if value.keywords and len(value.keywords) > 1:
+                        has_manual_construction = True
+                elif value_type is nodes.ListComp:
+                    if self._is_from_gitlab_listcomp(value):
+                        has_from_gitlab_listcomp = True
+            elif child_type is nodes.If and not returns_dict_literal:
+                returns_dict_literal = _if_returns_dict_literal(child)
+
+        if has_manual_construction:
             self.add_message("mcp-manual-construction", node=node, args=(node.name,))
 
-        # Check for dict literals in return statements
-        if self._returns_dict_literal(node):
+        if returns_dict_literal:
             self.add_message("mcp-dict-return", node=node, args=(node.name,))
 
-        # Check for list comprehensions with from_gitlab
-        if self._has_from_gitlab_list_comprehension(node):
+        if has_from_gitlab_listcomp:
             self.add_message("mcp-manual-list-comprehension", node=node, args=(node.name,))
 
     def _has_mcp_tool_decorator(self, node: nodes.FunctionDef) -> bool:
@@ -101,13 +162,9 @@ class MCPToolChecker(BaseChecker):
 
         for decorator in node.decorators.nodes:
             # Handle @mcp.tool or @mcp.tool(...)
-            if isinstance(decorator, nodes.Attribute):
-                if decorator.attrname == "tool":
-                    return True
-            elif isinstance(decorator, nodes.Call):
-                if isinstance(decorator.func, nodes.Attribute):
-                    if decorator.func.attrname == "tool":
-                        return True
+            dec = decorator.func if decorator.__class__ is nodes.Call else decorator
+            if dec.__class__ is nodes.Attribute and dec.attrname == "tool":
+                return True
         return False
 
     def _returns_dict(self, node: nodes.FunctionDef) -> bool:
@@ -116,90 +173,51 @@ class MCPToolChecker(BaseChecker):
             return False
 
         return_annotation = node.returns
+        annotation_type = return_annotation.__class__
 
         # Check for union types (A | B)
-        if isinstance(return_annotation, nodes.BinOp):
+        if annotation_type is nodes.BinOp:
             # Check both sides of the union
-            if self._contains_dict(return_annotation.left) or self._contains_dict(return_annotation.right):
-                return True
-
-        # Check for dict[...] or dict
-        if isinstance(return_annotation, nodes.Subscript):
-            if isinstance(return_annotation.value, nodes.Name):
-                if return_annotation.value.name == "dict":
-                    return True
-                # Check for list[dict[...]]
-                if return_annotation.value.name == "list":
-                    # Check if subscript contains dict
-                    if isinstance(return_annotation.slice, nodes.Subscript):
-                        if isinstance(return_annotation.slice.value, nodes.Name):
-                            if return_annotation.slice.value.name == "dict":
-                                return True
+            return self._contains_dict(return_annotation.left) or self._contains_dict(
+                return_annotation.right
+            )
 
         # Check for bare dict
-        if isinstance(return_annotation, nodes.Name):
-            if return_annotation.name == "dict":
+        if annotation_type is nodes.Name:
+            return return_annotation.name in _DICT_NAMES
+
+        # Check for dict[...] or list[dict[...]]
+        if annotation_type is nodes.Subscript:
+            value = return_annotation.value
+            if value.__class__ is not nodes.Name:
+                return False
+            name = value.name
+            if name in _DICT_NAMES:
                 return True
+            if name in _LIST_NAMES:
+                inner = return_annotation.slice
+                if inner.__class__ is nodes.Subscript:
+                    inner_value = inner.value
+                    return inner_value.__class__ is nodes.Name and inner_value.name in _DICT_NAMES
 
         return False
 
-    def _contains_dict(self, node) -> bool:
+    def _contains_dict(self, node: nodes.NodeNG) -> bool:
         """Check if a node is or contains dict."""
-        if isinstance(node, nodes.Name):
-            return node.name == "dict"
-        if isinstance(node, nodes.Subscript):
-            if isinstance(node.value, nodes.Name):
-                return node.value.name == "dict"
-        return False
-
-    def _has_manual_construction(self, node: nodes.FunctionDef) -> bool:
-        """Check if function manually constructs models with field mapping."""
-        for child in node.body:
-            if isinstance(child, nodes.Return):
-                if isinstance(child.value, nodes.Call):
-                    # Check if it's a model constructor with keyword arguments
-                    if child.value.keywords:
-                        # If there are multiple keyword args, it's likely manual construction
-                        if len(child.value.keywords) > 1:
-                            return True
-        return False
-
-    def _returns_dict_literal(self, node: nodes.FunctionDef) -> bool:
-        """Check if function returns dict literals anywhere in its body."""
-        for child in node.body:
-            if self._check_return_dict(child):
-                return True
-        return False
-
-    def _check_return_dict(self, node) -> bool:
-        """Recursively check if a node or its children return dict literals."""
-        if isinstance(node, nodes.Return):
-            if isinstance(node.value, nodes.Dict):
-                return True
-        # Check if statements (both branches)
-        if isinstance(node, nodes.If):
-            for child in node.body:
-                if self._check_return_dict(child):
-                    return True
-            for child in node.orelse:
-                if self._check_return_dict(child):
-                    return True
-        return False
-
-    def _has_from_gitlab_list_comprehension(self, node: nodes.FunctionDef) -> bool:
-        """Check if function uses list comprehension with from_gitlab."""
-        for child in node.body:
-            if isinstance(child, nodes.Return) and child.value:
-                if self._is_from_gitlab_listcomp(child.value):
-                    return True
+        node_type = node.__class__
+        if node_type is nodes.Name:
+            return node.name in _DICT_NAMES
+        if node_type is nodes.Subscript:
+            value = node.value
+            return value.__class__ is nodes.Name and value.name in _DICT_NAMES
         return False
 
-    def _is_from_gitlab_listcomp(self, node) -> bool:
+    def _is_from_gitlab_listcomp(self, node: nodes.ListComp) -> bool:
         """Check if node is a list comprehension calling from_gitlab."""
-        if isinstance(node, nodes.ListComp):
+        if node.__class__ is nodes.ListComp:
             # Check if the element expression calls from_gitlab
-            if isinstance(node.elt, nodes.Call):
-                if isinstance(node.elt.func, nodes.Attribute):
+            if node.elt.__class__ is nodes.Call:
+                if node.elt.func.__class__ is nodes.Attribute:
                     if node.elt.func.attrname == "from_gitlab":
                         return True
         return False
@@ -211,8 +229,8 @@ class MCPToolChecker(BaseChecker):
 
         for decorator in node.decorators.nodes:
             # Handle @field_serializer(...) call
-            if isinstance(decorator, nodes.Call):
-                if isinstance(decorator.func, nodes.Name):
+            if decorator.__class__ is nodes.Call:
+                if decorator.func.__class__ is nodes.Name:
                     if decorator.func.name == "field_serializer":
                         return True
         return False
@@ -228,19 +246,19 @@ class MCPToolChecker(BaseChecker):
             return False
 
         stmt = node.body[0]
-        if not isinstance(stmt, nodes.Return):
+        if stmt.__class__ is not nodes.Return:
             return False
 
         # Pattern: return func(v) if v else None
-        if isinstance(stmt.value, nodes.IfExp):
+        if stmt.value.__class__ is nodes.IfExp:
             # Check if test is just a name (the parameter)
-            if isinstance(stmt.value.test, nodes.Name):
+            if stmt.value.test.__class__ is nodes.Name:
                 # Check if body is a simple function call
-                if isinstance(stmt.value.body, nodes.Call):
+                if stmt.value.body.__class__ is nodes.Call:
                     return True
 
         # Pattern: return func(v)
-        if isinstance(stmt.value, nodes.Call):
+        if stmt.value.__class__ is nodes.Call:
             # Check if it's a simple function call with one argument
             if len(stmt.value.args) == 1:
                 return True
@@ -254,12 +272,12 @@ class MCPToolChecker(BaseChecker):
 
         for decorator in node.decorators.nodes:
             # Handle @computed_field
-            if isinstance(decorator, nodes.Name):
+            if decorator.__class__ is nodes.Name:
                 if decorator.name == "computed_field":
                     return True
             # Handle @computed_field(...)
-            elif isinstance(decorator, nodes.Call):
-                if isinstance(decorator.func, nodes.Name):
+            elif decorator.__class__ is nodes.Call:
+                if decorator.func.__class__ is nodes.Name:
                     if decorator.func.name == "computed_field":
                         return True
         return False
@@ -271,8 +289,8 @@ class MCPToolChecker(BaseChecker):
 
         for decorator in node.decorators.nodes:
             # Handle @field_validator(...) call
-            if isinstance(decorator, nodes.Call):
-                if isinstance(decorator.func, nodes.Name):
+            if decorator.__class__ is nodes.Call:
+                if decorator.func.__class__ is nodes.Name:
                     if decorator.func.name == "field_validator":
                         return True
         return False
@@ -287,19 +305,19 @@ class MCPToolChecker(BaseChecker):
             return False
 
         stmt = node.body[0]
-        if not isinstance(stmt, nodes.Return):
+        if stmt.__class__ is not nodes.Return:
             return False
 
         # Pattern: return relative_time(...) if ... else None
-        if isinstance(stmt.value, nodes.IfExp):
-            if isinstance(stmt.value.body, nodes.Call):
-                if isinstance(stmt.value.body.func, nodes.Name):
+        if stmt.value.__class__ is nodes.IfExp:
+            if stmt.value.body.__class__ is nodes.Call:
+                if stmt.value.body.func.__class__ is nodes.Name:
                     if stmt.value.body.func.name == "relative_time":
                         return True
 
         # Pattern: return relative_time(...)
-        if isinstance(stmt.value, nodes.Call):
-            if isinstance(stmt.value.func, nodes.Name):
+        if stmt.value.__class__ is nodes.Call:
+            if stmt.value.func.__class__ is nodes.Name:
                 if stmt.value.func.name == "relative_time":
                     return True
 
@@ -315,12 +333,12 @@ class MCPToolChecker(BaseChecker):
             return False
 
         stmt = node.body[0]
-        if not isinstance(stmt, nodes.Return):
+        if stmt.__class__ is not nodes.Return:
             return False
 
         # Pattern: return self.field_name
-        if isinstance(stmt.value, nodes.Attribute):
-            if isinstance(stmt.value.expr, nodes.Name):
+        if stmt.value.__class__ is nodes.Attribute:
+            if stmt.value.expr.__class__ is nodes.Name:
                 if stmt.value.expr.name == "self":
                     return True
 
@@ -336,12 +354,12 @@ class MCPToolChecker(BaseChecker):
             return False
 
         stmt = node.body[0]
-        if not isinstance(stmt, nodes.Return):
+        if stmt.__class__ is not nodes.Return:
             return False
 
         # Pattern: return safe_str(v)
-        if isinstance(stmt.value, nodes.Call):
-            if isinstance(stmt.value.func, nodes.Name):
+        if stmt.value.__class__ is nodes.Call:
+            if stmt.value.func.__class__ is nodes.Name:
                 if stmt.value.func.name == "safe_str":
                     # Check if it has exactly one argument
                     if len(stmt.value.args) == 1:
@@ -366,15 +384,15 @@ class MCPToolChecker(BaseChecker):
 
         # First statement should be: if not v: return []
         first_stmt = node.body[0]
-        if not isinstance(first_stmt, nodes.If):
+        if first_stmt.__class__ is not nodes.If:
             return False
 
         # Check if body has return statement with empty list
-        if len(first_stmt.body) != 1 or not isinstance(first_stmt.body[0], nodes.Return):
+        if len(first_stmt.body) != 1 or first_stmt.body[0].__class__ is not nodes.Return:
             return False
 
         return_stmt = first_stmt.body[0]
-        if not isinstance(return_stmt.value, nodes.List):
+        if return_stmt.value.__class__ is not nodes.List:
             return False
 
         if len(return_stmt.value.elts) != 0:
@@ -382,7 +400,7 @@ class MCPToolChecker(BaseChecker):
 
         # Second statement should be: return [SomeModel.from_gitlab(item) for item in v]
         second_stmt = node.body[1]
-        if not isinstance(second_stmt, nodes.Return):
+        if second_stmt.__class__ is not nodes.Return:
             return False
 
         # Check if it's a list comprehension calling from_gitlab
@@ -392,6 +410,6 @@ class MCPToolChecker(BaseChecker):
         return False
 
 
-def register(linter):
+def register(linter: "PyLinter") -> None:
     """Register the checker with pylint."""
     linter.register_checker(MCPToolChecker(linter))
@@ -1,20 +1,74 @@
 """GitLab API client wrapper."""
 
+import json
+import socket
+import threading
+import time
 import gitlab
 import requests
+from functools import lru_cache
 from typing import Any
 from gitlab.v4.objects import Project
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 from urllib3.util.retry import Retry
 from gitlab_mcp.config import get_config
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; the stdlib decoder is the fallback
+    _json_loads = json.loads
+
 
 # Global client instance
 _client: gitlab.Gitlab | None = None
+_client_lock = threading.Lock()
+
+# Recent get_project() 404s: pid -> (error, expiry). Kept briefly so repeated
+# bad IDs don't go back to GitLab every call, but short enough that a project
+# created moments later is picked up.
+_PROJECT_MISS_TTL = 30
+_PROJECT_MISS_CACHE_MAXSIZE = 64
+_project_misses: dict[str, tuple[gitlab.exceptions.GitlabGetError, float]] = {}
+_project_misses_lock = threading.Lock()
+
+
+# Retry policy shared by every session
+_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+_ALLOWED_METHODS = frozenset(("HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"))
+
+# Keep idle pooled connections alive at the TCP level between tool calls
+_KEEPALIVE_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class _KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections enable TCP keepalive."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", _KEEPALIVE_SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+@lru_cache(maxsize=8)
+def _make_retry(retry_count: int, backoff_factor: float) -> Retry:
+    """Build the retry strategy (cached; urllib3 never mutates a Retry in place)."""
+    return Retry(
+        total=retry_count,
+        backoff_factor=backoff_factor,
+        status_forcelist=_STATUS_FORCELIST,
+        allowed_methods=_ALLOWED_METHODS,
+        respect_retry_after_header=True,
+    )
 
 
 def _create_session_with_retries(
-    retry_count: int = 3, backoff_factor: float = 0.5, timeout: int = 30
+    retry_count: int = 3,
+    backoff_factor: float = 0.5,
+    timeout: int = 30,
+    pool_connections: int = 32,
+    pool_maxsize: int = 64,
 ) -> requests.Session:
     """Create a requests Session with retry and connection pooling configuration.
 
@@ -22,6 +76,8 @@ def _create_session_with_retries(
         retry_count: Number of retry attempts
         backoff_factor: Backoff factor for retries (delay = backoff_factor * (2 ** retry_number))
         timeout: Request timeout in seconds
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum connections kept alive per pool
 
     Returns:
         Configured requests Session
@@ -29,18 +85,15 @@ def _create_session_with_retries(
     session = requests.Session()
 
     # Configure retry strategy
-    retry_strategy = Retry(
-        total=retry_count,
-        backoff_factor=backoff_factor,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"],
-    )
+    retry_strategy = _make_retry(retry_count, backoff_factor)
 
-    # Create adapter with retry strategy and connection pooling
-    adapter = HTTPAdapter(
+    # Create adapter with retry strategy and connection pooling. pool_block=False
+    # lets bursts beyond pool_maxsize open extra connections instead of waiting.
+    adapter = _KeepAliveHTTPAdapter(
         max_retries=retry_strategy,
-        pool_connections=10,
-        pool_maxsize=20,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=False,
     )
 
     # Mount adapter for both http and https
@@ -53,40 +106,110 @@ def _create_session_with_retries(
 def get_client() -> gitlab.Gitlab:
     """Get the GitLab API client with authentication and retry configuration."""
     global _client
-    if _client is None:
-        config = get_config()
-
-        # Create session with retry and connection pooling
-        session = _create_session_with_retries(
-            retry_count=config.retry_count,
-            backoff_factor=config.retry_backoff,
-            timeout=config.timeout,
-        )
+    client = _client
+    if client is not None:
+        return client
+
+    with _client_lock:
+        if _client is None:
+            config = get_config()
+
+            # Create session with retry and connection pooling
+            session = _create_session_with_retries(
+                retry_count=config.retry_count,
+                backoff_factor=config.retry_backoff,
+                timeout=config.timeout,
+                pool_connections=config.pool_connections,
+                pool_maxsize=config.pool_maxsize,
+            )
+
+            # Determine authentication method (priority: OAuth > Session Cookie > Personal Access Token)
+            auth_kwargs: dict[str, Any] = {}
+            if config.oauth_token:
+                auth_kwargs["oauth_token"] = config.oauth_token
+            elif config.session_cookie:
+                # For cookie-based auth, set the session cookie directly
+                session.cookies.set("_gitlab_session", config.session_cookie)
+            elif config.token:
+                auth_kwargs["private_token"] = config.token
+
+            _client = gitlab.Gitlab(
+                url=config.gitlab_url,
+                session=session,
+                timeout=config.timeout,
+                **auth_kwargs,
+            )
+        client = _client
+
+    return client
+
+
+def resolve_project_id(project_id: str | None = None) -> str:
+    """Return the project ID to use, falling back to default if configured."""
+    pid = project_id or get_config().default_project_id
+    if not pid:
+        raise ValueError("project_id is required (no default configured)")
+    return pid
 
-        # Determine authentication method (priority: OAuth > Session Cookie > Personal Access Token)
-        auth_kwargs: dict[str, Any] = {}
-        if config.oauth_token:
-            auth_kwargs["oauth_token"] = config.oauth_token
-        elif config.session_cookie:
-            # For cookie-based auth, set the session cookie directly
-            session.cookies.set("_gitlab_session", config.session_cookie)
-        elif config.token:
-            auth_kwargs["private_token"] = config.token
-
-        _client = gitlab.Gitlab(
-            url=config.gitlab_url,
-            session=session,
-            timeout=config.timeout,
-            **auth_kwargs,
+
+def get_project(project_id: str | None = None, lazy: bool = False) -> Project:
+    """Get a project by ID, falling back to default if configured.
+
+    Pass lazy=True when only the project's sub-resources (MRs, issues, ...)
+    are needed: the handle is built without requesting the project itself,
+    so its own attributes aren't available. 404s are remembered briefly so
+    repeated bad IDs don't go back to GitLab every call.
+    """
+    client = get_client()
+    pid = resolve_project_id(project_id)
+
+    now = time.monotonic()
+    miss = _project_misses.get(pid)
+    if miss is not None and now < miss[1]:
+        error = miss[0]
+        # Raise a new instance so the cached one doesn't accumulate tracebacks
+        raise gitlab.exceptions.GitlabGetError(
+            error.error_message, error.response_code, error.response_body
         )
 
-    return _client
+    if lazy:
+        return client.projects.get(pid, lazy=True)
+    try:
+        return client.projects.get(pid)
+    except gitlab.exceptions.GitlabGetError as e:
+        if e.response_code == 404:
+            _remember_project_miss(pid, e, now + _PROJECT_MISS_TTL)
+        raise
 
 
-def get_project(project_id: str | None = None) -> Project:
-    """Get a project by ID, falling back to default if configured."""
-    config = get_config()
-    pid = project_id or config.default_project_id
-    if not pid:
-        raise ValueError("project_id is required (no default configured)")
-    return get_client().projects.get(pid)
+def _remember_project_miss(
+    pid: str, error: gitlab.exceptions.GitlabGetError, expiry: float
+) -> None:
+    """Store a get_project() 404, evicting the oldest entry when full."""
+    with _project_misses_lock:
+        if pid not in _project_misses and len(_project_misses) >= _PROJECT_MISS_CACHE_MAXSIZE:
+            _project_misses.pop(next(iter(_project_misses)))
+        _project_misses[pid] = (error, expiry)
+
+
+def clear_project_cache() -> None:
+    """Forget all remembered get_project() misses."""
+    with _project_misses_lock:
+        _project_misses.clear()
+
+
+def get_json(path: str, params: dict[str, Any] | None = None) -> Any:
+    """GET a REST path and return the decoded JSON body.
+
+    Goes through python-gitlab's HTTP layer, so auth, retries and error
+    handling match manager calls, but skips building a RESTObject per
+    item. Intended for hot list endpoints whose models are built with
+    ``from_gitlab_dict()``.
+    """
+    response = get_client().http_get(path, query_data=params, raw=True)
+    try:
+        return _json_loads(response.content)
+    except ValueError as e:
+        raise gitlab.exceptions.GitlabParsingError(
+            error_message="Failed to parse the server message"
+        ) from e
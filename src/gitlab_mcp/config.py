@@ -1,10 +1,11 @@
 """Configuration for GitLab MCP server."""
 
 import os
+import threading
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """Server configuration from environment variables."""
 
@@ -17,6 +18,8 @@ class Config:
     retry_count: int = 3
     retry_backoff: float = 0.5
     timeout: int = 30
+    pool_connections: int = 32
+    pool_maxsize: int = 64
     disable_wiki: bool = False
     disable_releases: bool = False
     disable_graphql: bool = False
@@ -42,6 +45,10 @@ class Config:
         retry_backoff = float(os.environ.get("GITLAB_RETRY_BACKOFF", "0.5"))
         timeout = int(os.environ.get("GITLAB_TIMEOUT", "30"))
 
+        # Parse connection pool configuration
+        pool_connections = int(os.environ.get("GITLAB_POOL_CONNECTIONS", "32"))
+        pool_maxsize = int(os.environ.get("GITLAB_POOL_MAXSIZE", "64"))
+
         # Parse feature toggles
         disable_wiki = os.environ.get("GITLAB_DISABLE_WIKI", "").lower() == "true"
         disable_releases = os.environ.get("GITLAB_DISABLE_RELEASES", "").lower() == "true"
@@ -58,6 +65,8 @@ class Config:
             retry_count=retry_count,
             retry_backoff=retry_backoff,
             timeout=timeout,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
             disable_wiki=disable_wiki,
             disable_releases=disable_releases,
             disable_graphql=disable_graphql,
@@ -67,11 +76,16 @@ class Config:
 
 # Global config instance
 _config: Config | None = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> Config:
-    """Get the global configuration."""
+    """Get the global configuration (loaded once, thread-safe)."""
     global _config
-    if _config is None:
-        _config = Config.from_env()
-    return _config
+    config = _config
+    if config is None:
+        with _config_lock:
+            if _config is None:
+                _config = Config.from_env()
+            config = _config
+    return config
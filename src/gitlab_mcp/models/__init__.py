@@ -22,6 +22,7 @@ from gitlab_mcp.models.issues import (
     IssueLinkDeleteResult,
     RelatedMergeRequest,
     IssueTimeStats,
+    IssueTimeStatsSummary,
 )
 from gitlab_mcp.models.repository import (
     FileSummary,
@@ -92,6 +93,7 @@ __all__ = [
     "IssueLinkDeleteResult",
     "RelatedMergeRequest",
     "IssueTimeStats",
+    "IssueTimeStatsSummary",
     # Repository
     "FileSummary",
     "FileContents",
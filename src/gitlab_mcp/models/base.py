@@ -1,44 +1,80 @@
 """Base model classes and shared utilities."""
 
 import re
-from datetime import datetime, timezone
-from typing import Annotated, overload
+import sys
+import time
+from bisect import bisect_right
+from collections.abc import Callable
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Annotated, Any, ClassVar, overload
 
 from gitlab.base import RESTObject
-from pydantic import BaseModel, ConfigDict, PlainSerializer, field_validator
+from pydantic import BaseModel, BeforeValidator, ConfigDict, PlainSerializer, TypeAdapter
 
 try:
     from typing import Self
 except ImportError:
     from typing_extensions import Self
 
+try:
+    # Optional speedup; handles GitLab's "...Z" timestamps natively
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    # Python 3.11+ fromisoformat also accepts a trailing "Z"
+    _parse_datetime = datetime.fromisoformat
+
 
 def safe_str(text: str | None) -> str:
     """Safely convert text to string, handling None."""
     return text or ""
 
 
+def intern_str(v: Any) -> Any:
+    """Intern strings drawn from small vocabularies (usernames, states).
+
+    Large responses repeat the same few values; interning shares one object.
+    """
+    return sys.intern(v) if type(v) is str else v
+
+
+def author_username(v: Any) -> Any:
+    """Flatten a nested GitLab author dict to its (interned) username."""
+    if type(v) is dict:
+        return intern_str(v.get("username", "unknown"))
+    return v
+
+
+def short_sha(v: Any) -> Any:
+    """Shorten a commit SHA to 8 characters for display."""
+    return v[:8] if type(v) is str else v
+
+
+def empty_str_to_none(v: Any) -> Any:
+    """Convert empty strings to None for consistency."""
+    return None if v == "" else v
+
+
 class BaseGitLabModel(BaseModel):
     """Base class for all GitLab response models.
 
     Provides common configuration for JSON serialization, validation helpers,
-    and timezone handling for all GitLab API response models.
+    and timezone handling for all GitLab API response models. Optional text
+    fields that GitLab may send as "" should be typed EmptyStrToNone.
     """
 
     model_config = ConfigDict(
         from_attributes=True,
         populate_by_name=True,
-        json_encoders={datetime: lambda v: v.isoformat()},
         ser_json_timedelta="float",
     )
 
-    @field_validator("*", mode="before")
-    @classmethod
-    def validate_none_strings(cls, v):
-        """Convert empty strings to None for consistency."""
-        if isinstance(v, str) and v == "":
-            return None
-        return v
+    # Opt-in for models whose fields are all plain values with no validators:
+    # from_gitlab() and from_gitlab_dict() then build instances with
+    # model_construct() straight from the attribute dicts / raw JSON,
+    # skipping validation entirely. A trusted model with nested model fields
+    # must override both constructors so its children are built as well.
+    __gitlab_trusted__: ClassVar[bool] = False
 
     @overload
     @classmethod
@@ -80,25 +116,138 @@ class BaseGitLabModel(BaseModel):
             # ✅ For dicts, use model_validate
             summary = IssueSummary.model_validate({"iid": 1})
         """
-        # Handle list of objects
+        # Handle list of objects: validate the whole list in one pydantic-core call
         if isinstance(obj, list):
-            return [cls.from_gitlab(item) for item in obj]
+            if cls.__gitlab_trusted__ or (obj and type(obj[0]) is dict):
+                return [cls.from_gitlab(item) for item in obj]
+            return cls._list_adapter().validate_python(obj, from_attributes=True)
 
-        # Reject plain dicts
-        if isinstance(obj, dict) and not hasattr(obj, '__dict__'):
+        # Reject plain dicts (exact type check; a pointer compare per object)
+        if type(obj) is dict:
             raise TypeError(
                 f"from_gitlab() expects a GitLab RESTObject, not a plain dict. "
                 f"Use {cls.__name__}.model_validate() for dict construction."
             )
 
-        return cls.model_validate(obj, from_attributes=True)
+        if cls.__gitlab_trusted__ and isinstance(obj, RESTObject):
+            return cls.model_construct(**rest_attrs(obj))
+
+        # Straight to the class's compiled validator (what model_validate wraps)
+        return cls.__pydantic_validator__.validate_python(obj, from_attributes=True)
+
+    @classmethod
+    def _list_adapter(cls) -> TypeAdapter[list[Self]]:
+        """Return the cached list[cls] adapter, building it on first use."""
+        adapter = _LIST_ADAPTERS.get(cls)
+        if adapter is None:
+            adapter = _LIST_ADAPTERS[cls] = TypeAdapter(list[cls])
+        return adapter
+
+    @overload
+    @classmethod
+    def from_gitlab_dict(cls, data: dict[str, Any]) -> Self: ...
+
+    @overload
+    @classmethod
+    def from_gitlab_dict(cls, data: list[dict[str, Any]]) -> list[Self]: ...
+
+    @classmethod
+    def from_gitlab_dict(cls, data: dict[str, Any] | list[dict[str, Any]]) -> Self | list[Self]:
+        """Build model instance(s) from raw GitLab JSON.
+
+        Counterpart to from_gitlab() for responses fetched with
+        ``client.get_json()``, where no RESTObject was ever constructed,
+        and for dicts assembled from raw API payloads. Trusted models skip
+        validation here too.
+
+        Args:
+            data: Decoded JSON object or list of objects
+
+        Returns:
+            Model instance or list of instances
+        """
+        if cls.__gitlab_trusted__:
+            if isinstance(data, list):
+                return [cls.model_construct(**item) for item in data]
+            return cls.model_construct(**data)
+        if isinstance(data, list):
+            return cls._list_adapter().validate_python(data)
+        return cls.__pydantic_validator__.validate_python(data)
+
+
+# TypeAdapter(list[Model]) per model class, used by from_gitlab() for lists
+_LIST_ADAPTERS: dict[type[BaseGitLabModel], TypeAdapter[Any]] = {}
 
 
-def relative_time(dt: datetime | str | None) -> str:
+def rest_attrs(obj: RESTObject) -> dict[str, Any]:
+    """Merge a RESTObject's attribute dicts (shallow; no asdict() deepcopy)."""
+    d = obj.__dict__
+    return {**d["_parent_attrs"], **d["_attrs"], **d["_updated_attrs"]}
+
+
+def _unit_formatter(unit_seconds: int, unit: str) -> Callable[[float], str]:
+    """Build a formatter reporting elapsed seconds in whole units of ``unit``."""
+    singular = f"1 {unit} ago"
+    plural_suffix = f" {unit}s ago"
+
+    def fmt(seconds: float) -> str:
+        n = int(seconds / unit_seconds)
+        return singular if n == 1 else f"{n}{plural_suffix}"
+
+    return fmt
+
+
+# Upper bound (exclusive) in seconds of each relative_time bucket; bisect picks
+# the index into _FORMATTERS, the last formatter handles everything beyond.
+_THRESHOLDS = (60, 3600, 86400, 604800, 2592000)
+_FORMATTERS: tuple[Callable[[float], str], ...] = (
+    lambda seconds: "just now",
+    _unit_formatter(60, "minute"),
+    _unit_formatter(3600, "hour"),
+    _unit_formatter(86400, "day"),
+    _unit_formatter(604800, "week"),
+    _unit_formatter(2592000, "month"),
+)
+
+
+@lru_cache(maxsize=4096)
+def parse_iso(value: str) -> datetime:
+    """Parse a GitLab ISO 8601 timestamp (cached; payloads repeat timestamps)."""
+    return _parse_datetime(value)
+
+
+# relative_time() results for ISO strings are cached per time bucket, so the
+# same timestamp is formatted once per bucket rather than once per field;
+# a cached string can lag the clock by up to this many seconds.
+_NOW_BUCKET_SECONDS = 30
+
+
+# (whole second, first datetime seen in it) for utc_now()
+_now_cache: tuple[int, datetime] = (0, datetime.fromtimestamp(0, UTC))
+
+
+def utc_now() -> datetime:
+    """Current UTC time, reused for calls landing in the same second."""
+    global _now_cache
+    t = time.time()
+    if int(t) != _now_cache[0]:
+        _now_cache = (int(t), datetime.fromtimestamp(t, UTC))
+    return _now_cache[1]
+
+
+@lru_cache(maxsize=4096)
+def _relative_time_cached(value: str, bucket: int) -> str:
+    """Format an ISO timestamp relative to now; ``bucket`` only keys the cache."""
+    return relative_time(parse_iso(value), utc_now())
+
+
+def relative_time(dt: datetime | str | None, now: datetime | None = None) -> str:
     """Format datetime as human-readable relative time (English only).
 
     Args:
         dt: DateTime object, ISO string, or None
+        now: Reference time (defaults to current UTC time). Pass a single value
+            when formatting many timestamps for one response.
 
     Returns:
         Relative time string like "2 hours ago", "just now"
@@ -111,40 +260,28 @@ def relative_time(dt: datetime | str | None) -> str:
         return "unknown"
 
     if isinstance(dt, str):
-        dt = datetime.fromisoformat(dt.replace("Z", "+00:00"))
+        if now is None:
+            return _relative_time_cached(dt, int(time.time()) // _NOW_BUCKET_SECONDS)
+        dt = parse_iso(dt)
 
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+        dt = dt.replace(tzinfo=UTC)
 
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(UTC)
     seconds = (now - dt).total_seconds()
 
     if seconds < 0:
         return "in the future"
-    elif seconds < 60:
-        return "just now"
-    elif seconds < 3600:
-        mins = int(seconds / 60)
-        return f"{mins} minute ago" if mins == 1 else f"{mins} minutes ago"
-    elif seconds < 86400:
-        hours = int(seconds / 3600)
-        return f"{hours} hour ago" if hours == 1 else f"{hours} hours ago"
-    elif seconds < 604800:
-        days = int(seconds / 86400)
-        return f"{days} day ago" if days == 1 else f"{days} days ago"
-    elif seconds < 2592000:
-        weeks = int(seconds / 604800)
-        return f"{weeks} week ago" if weeks == 1 else f"{weeks} weeks ago"
-    else:
-        months = int(seconds / 2592000)
-        return f"{months} month ago" if months == 1 else f"{months} months ago"
-
-
-def format_timestamp_with_relative(dt: datetime | str | None) -> str:
+    return _FORMATTERS[bisect_right(_THRESHOLDS, seconds)](seconds)
+
+
+def format_timestamp_with_relative(dt: datetime | str | None, now: datetime | None = None) -> str:
     """Format timestamp as 'relative time (ISO8601)'.
 
     Args:
         dt: DateTime object, ISO string, or None
+        now: Reference time passed through to relative_time()
 
     Returns:
         Combined format like "2 hours ago (2024-01-15T10:30:00Z)"
@@ -157,37 +294,56 @@ def format_timestamp_with_relative(dt: datetime | str | None) -> str:
         return "unknown"
 
     if isinstance(dt, str):
-        iso_str = dt
-        dt_obj = datetime.fromisoformat(dt.replace("Z", "+00:00"))
-    else:
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        iso_str = dt.isoformat().replace("+00:00", "Z")
-        dt_obj = dt
+        return f"{relative_time(dt, now)} ({dt})"
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    iso_str = dt.isoformat().replace("+00:00", "Z")
+    return f"{relative_time(dt, now)} ({iso_str})"
+
+
+def _serialize_relative_time(v: str) -> str:
+    """Serializer for RelativeTime (one-argument wrapper; no ``now``)."""
+    return format_timestamp_with_relative(v)
 
-    relative = relative_time(dt_obj)
-    return f"{relative} ({iso_str})"
+
+def _serialize_relative_time_optional(v: str | None) -> str | None:
+    """Serializer for RelativeTimeOptional; unset timestamps stay None."""
+    return format_timestamp_with_relative(v) if v else None
 
 
 # Type alias for timestamp fields: formats as "relative (ISO8601)"
 RelativeTime = Annotated[
     str,
-    PlainSerializer(lambda v: format_timestamp_with_relative(v), return_type=str),
+    PlainSerializer(_serialize_relative_time, return_type=str),
 ]
 
-# Type alias for optional timestamp fields
+# Type alias for optional timestamp fields ("" means unset)
 RelativeTimeOptional = Annotated[
     str | None,
-    PlainSerializer(
-        lambda v: format_timestamp_with_relative(v) if v else None, return_type=str | None
-    ),
+    BeforeValidator(empty_str_to_none),
+    PlainSerializer(_serialize_relative_time_optional, return_type=str | None),
 ]
 
-# Type alias for string fields that should convert None to empty string
-SafeString = Annotated[
-    str | None,
-    PlainSerializer(lambda v: safe_str(v), return_type=str),
-]
+# Type alias for optional text fields where GitLab sends "" for unset values
+EmptyStrToNone = Annotated[str | None, BeforeValidator(empty_str_to_none)]
+
+# Type alias for author fields reduced to the username string
+AuthorUsername = Annotated[str, BeforeValidator(author_username)]
+
+# Type alias for commit SHAs shown in short (8-character) form
+ShortSha = Annotated[str, BeforeValidator(short_sha)]
+
+# Type alias for enum-like string fields (state, status, visibility) that
+# repeat across every item of a list response
+InternedStr = Annotated[str, BeforeValidator(intern_str)]
+
+# Optional enum-like string fields; "" means unset
+OptionalInternedStr = Annotated[InternedStr | None, BeforeValidator(empty_str_to_none)]
+
+# Type alias for string fields that should convert None to empty string.
+# Coerced once at validation so dumping is a plain str copy.
+SafeString = Annotated[str, BeforeValidator(safe_str)]
 
 _HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
 _DETAILS_BLOCK_RE = re.compile(
@@ -238,11 +394,13 @@ def clean_note_body_raw(text: str | None) -> str:
 # Type alias for note body fields: strips HTML comments and <details> blocks
 HtmlCommentFree = Annotated[
     str | None,
-    PlainSerializer(lambda v: clean_note_body(v), return_type=str),
+    BeforeValidator(empty_str_to_none),
+    PlainSerializer(clean_note_body, return_type=str),
 ]
 
 # Type alias for raw mode: strips only long HTML comments (>200 chars)
 RawClean = Annotated[
     str | None,
-    PlainSerializer(lambda v: clean_note_body_raw(v), return_type=str),
+    BeforeValidator(empty_str_to_none),
+    PlainSerializer(clean_note_body_raw, return_type=str),
 ]
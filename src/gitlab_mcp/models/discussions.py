@@ -1,13 +1,20 @@
 """Discussion and note models."""
 
-from pydantic import Field, model_validator
+from typing import Any, Self, TypeVar
+
+from gitlab.base import RESTObject
+from pydantic import Field
 
 from gitlab_mcp.models.base import (
+    AuthorUsername,
     BaseGitLabModel,
+    EmptyStrToNone,
     HtmlCommentFree,
     RawClean,
     RelativeTime,
     RelativeTimeOptional,
+    author_username,
+    rest_attrs,
 )
 
 
@@ -16,7 +23,7 @@ class NoteSummary(BaseGitLabModel):
 
     id: int = Field(description="Note ID")
     body: HtmlCommentFree = Field(description="Comment text")
-    author: str = Field(description="Author username")
+    author: AuthorUsername = Field(description="Author username")
     created_at: RelativeTime = Field(description="When created (ISO timestamp)")
     updated_at: RelativeTimeOptional = Field(
         default=None, description="When last updated (ISO timestamp)"
@@ -25,29 +32,68 @@ class NoteSummary(BaseGitLabModel):
     resolvable: bool | None = Field(default=False, description="True if this note can be resolved", exclude=True)
     resolved: bool | None = Field(default=False, description="True if this note is resolved", exclude=True)
 
-    @model_validator(mode="before")
-    @classmethod
-    def flatten_author(cls, data):
-        """Flatten nested author dict to username string."""
-        if isinstance(data, dict):
-            author = data.get("author")
-            if isinstance(author, dict):
-                data = dict(data)
-                data["author"] = author.get("username", "unknown")
-            return data
-        author = getattr(data, "author", None)
-        if isinstance(author, dict):
-            return {
-                "id": getattr(data, "id", None),
-                "body": getattr(data, "body", ""),
-                "author": author.get("username", "unknown"),
-                "created_at": getattr(data, "created_at", ""),
-                "updated_at": getattr(data, "updated_at", None),
-                "system": getattr(data, "system", False),
-                "resolvable": getattr(data, "resolvable", False),
-                "resolved": getattr(data, "resolved", False),
-            }
-        return data
+
+def _discussion_payload(obj: Any, with_count: bool = False) -> dict[str, Any]:
+    """Build the construction input for a GitLab Discussion object or raw dict.
+
+    Notes come from the raw attributes (already fetched in the API response),
+    read shallowly rather than through RESTObject.attributes, which deep-copies.
+    """
+    if type(obj) is dict:
+        attrs = obj
+        discussion_id = obj["id"]
+        individual_note = obj.get("individual_note", False)
+    else:
+        attrs = rest_attrs(obj) if isinstance(obj, RESTObject) else getattr(obj, "attributes", {})
+        discussion_id = obj.id
+        individual_note = getattr(obj, "individual_note", False)
+    raw_notes = attrs.get("notes")
+    if raw_notes is None:
+        notes_data = []
+    elif isinstance(raw_notes, list):
+        notes_data = raw_notes
+    elif hasattr(raw_notes, "list"):
+        # python-gitlab may wrap notes in a manager object
+        notes_data = [n.attributes for n in raw_notes.list()]
+    else:
+        notes_data = list(raw_notes)
+
+    payload = {
+        "id": discussion_id,
+        "notes": notes_data,
+        "individual_note": individual_note,
+    }
+    if with_count:
+        payload["note_count"] = len(notes_data)
+    return payload
+
+
+# Keys every GitLab note carries; model_construct() would silently leave
+# a missing one out of the output, so such notes go through validation
+_NOTE_REQUIRED_KEYS = frozenset(("id", "body", "author", "created_at"))
+
+
+def _construct_note(note_cls: type[NoteSummary], note: dict[str, Any]) -> NoteSummary:
+    """Build a trusted note, validating it instead if a required key is missing."""
+    if not _NOTE_REQUIRED_KEYS <= note.keys():
+        return note_cls.model_validate(note)
+    return note_cls.model_construct(**{**note, "author": author_username(note["author"])})
+
+
+_DiscussionT = TypeVar("_DiscussionT", "DiscussionSummary", "DiscussionDetail")
+
+
+def _construct_discussion(
+    cls: type[_DiscussionT], note_cls: type[NoteSummary], obj: Any, with_count: bool = False
+) -> _DiscussionT:
+    """Build a trusted discussion without re-validating each note.
+
+    Only the nested author dict needs reshaping; everything else in the
+    GitLab response already has the declared types.
+    """
+    payload = _discussion_payload(obj, with_count=with_count)
+    payload["notes"] = [_construct_note(note_cls, note) for note in payload["notes"]]
+    return cls.model_construct(**payload)
 
 
 class NoteDetail(NoteSummary):
@@ -59,6 +105,8 @@ class NoteDetail(NoteSummary):
 class DiscussionDetail(BaseGitLabModel):
     """Full discussion thread with unstripped note bodies."""
 
+    __gitlab_trusted__ = True
+
     id: str = Field(description="Discussion ID")
     notes: list[NoteDetail] = Field(
         default_factory=list, description="List of notes in discussion"
@@ -66,26 +114,23 @@ class DiscussionDetail(BaseGitLabModel):
     individual_note: bool = Field(default=False, description="True if single comment, not a thread")
 
     @classmethod
-    def from_gitlab(cls, obj):
+    def from_gitlab(cls, obj: RESTObject | list[RESTObject]) -> Self | list[Self]:
         """Transform GitLab Discussion object(s) to model instance(s)."""
         if isinstance(obj, list):
-            return [cls.from_gitlab(item) for item in obj]
+            return [cls.from_gitlab(d) for d in obj]
+        if type(obj) is dict:
+            raise TypeError(
+                f"from_gitlab() expects a GitLab RESTObject, not a plain dict. "
+                f"Use {cls.__name__}.from_gitlab_dict() for raw JSON."
+            )
+        return _construct_discussion(cls, NoteDetail, obj)
 
-        notes_data = []
-        if hasattr(obj, 'attributes') and 'notes' in obj.attributes:
-            raw_notes = obj.attributes['notes']
-            if isinstance(raw_notes, list):
-                notes_data = raw_notes
-            elif hasattr(raw_notes, 'list'):
-                notes_data = [n.attributes for n in raw_notes.list()]
-            else:
-                notes_data = list(raw_notes)
-
-        return cls.model_validate({
-            'id': obj.id,
-            'notes': notes_data,
-            'individual_note': getattr(obj, 'individual_note', False),
-        })
+    @classmethod
+    def from_gitlab_dict(cls, data: dict[str, Any] | list[dict[str, Any]]) -> Self | list[Self]:
+        """Build discussion(s) from raw GitLab JSON, constructing nested notes too."""
+        if isinstance(data, list):
+            return [_construct_discussion(cls, NoteDetail, d) for d in data]
+        return _construct_discussion(cls, NoteDetail, data)
 
 
 class DiscussionSummary(BaseGitLabModel):
@@ -95,6 +140,8 @@ class DiscussionSummary(BaseGitLabModel):
     include_all_notes=True on the tool to get every note.
     """
 
+    __gitlab_trusted__ = True
+
     id: str = Field(description="Discussion ID")
     state: str = Field(default="comment", description="Discussion state: resolved, unresolved, or comment")
     note_count: int = Field(default=0, description="Total number of notes in discussion")
@@ -104,30 +151,23 @@ class DiscussionSummary(BaseGitLabModel):
     individual_note: bool = Field(default=False, description="True if single comment, not a thread")
 
     @classmethod
-    def from_gitlab(cls, obj):
+    def from_gitlab(cls, obj: RESTObject | list[RESTObject]) -> Self | list[Self]:
         """Transform GitLab Discussion object(s) to model instance(s)."""
-        # Handle list of discussions
         if isinstance(obj, list):
-            return [cls.from_gitlab(item) for item in obj]
+            return [cls.from_gitlab(d) for d in obj]
+        if type(obj) is dict:
+            raise TypeError(
+                f"from_gitlab() expects a GitLab RESTObject, not a plain dict. "
+                f"Use {cls.__name__}.from_gitlab_dict() for raw JSON."
+            )
+        return _construct_discussion(cls, NoteSummary, obj, with_count=True)
 
-        # Extract notes from raw attributes (already fetched in API response)
-        notes_data = []
-        if hasattr(obj, 'attributes') and 'notes' in obj.attributes:
-            raw_notes = obj.attributes['notes']
-            if isinstance(raw_notes, list):
-                notes_data = raw_notes
-            elif hasattr(raw_notes, 'list'):
-                # python-gitlab may wrap notes in a manager object
-                notes_data = [n.attributes for n in raw_notes.list()]
-            else:
-                notes_data = list(raw_notes)
-
-        return cls.model_validate({
-            'id': obj.id,
-            'note_count': len(notes_data),
-            'notes': notes_data,
-            'individual_note': getattr(obj, 'individual_note', False),
-        })
+    @classmethod
+    def from_gitlab_dict(cls, data: dict[str, Any] | list[dict[str, Any]]) -> Self | list[Self]:
+        """Build discussion(s) from raw GitLab JSON, constructing nested notes too."""
+        if isinstance(data, list):
+            return [_construct_discussion(cls, NoteSummary, d, with_count=True) for d in data]
+        return _construct_discussion(cls, NoteSummary, data, with_count=True)
 
 
 class NoteDeleteResult(BaseGitLabModel):
@@ -136,7 +176,7 @@ class NoteDeleteResult(BaseGitLabModel):
     deleted: bool = Field(description="True if note was deleted")
     note_id: int = Field(description="ID of the deleted note")
     merge_request_iid: int | None = Field(default=None, description="MR IID if applicable")
-    discussion_id: str | None = Field(default=None, description="Discussion ID if applicable")
+    discussion_id: EmptyStrToNone = Field(default=None, description="Discussion ID if applicable")
 
 
 class DiscussionNoteDeleteResult(BaseGitLabModel):
@@ -1,15 +1,20 @@
 """Draft note models."""
 
-from pydantic import Field, field_validator
-from gitlab_mcp.models.base import BaseGitLabModel, HtmlCommentFree, RelativeTime
+from pydantic import AliasChoices, Field, field_validator
+
+from gitlab_mcp.models.base import BaseGitLabModel, EmptyStrToNone, HtmlCommentFree, RelativeTime
 
 
 class DraftNoteSummary(BaseGitLabModel):
     """AI-optimized draft note summary."""
 
     id: int = Field(description="Draft note ID")
-    body: HtmlCommentFree = Field(description="Draft note body text")
-    in_reply_to_discussion_id: str | None = Field(
+    body: HtmlCommentFree = Field(
+        description="Draft note body text",
+        # The draft notes API returns the text as "note"
+        validation_alias=AliasChoices("note", "body"),
+    )
+    in_reply_to_discussion_id: EmptyStrToNone = Field(
         default=None, description="Discussion ID if this is a reply"
     )
     created_at: RelativeTime = Field(description="When created (relative time)")
@@ -4,7 +4,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
-from gitlab_mcp.models.base import BaseGitLabModel
+from gitlab_mcp.models.base import BaseGitLabModel, EmptyStrToNone
 
 
 class GraphQLError(BaseModel):
@@ -29,8 +29,8 @@ class PageInfo(BaseGitLabModel):
 
     has_next_page: bool = Field(default=False, description="Whether there are more pages")
     has_previous_page: bool = Field(default=False, description="Whether there are previous pages")
-    start_cursor: str | None = Field(default=None, description="Cursor for first item")
-    end_cursor: str | None = Field(default=None, description="Cursor for last item")
+    start_cursor: EmptyStrToNone = Field(default=None, description="Cursor for first item")
+    end_cursor: EmptyStrToNone = Field(default=None, description="Cursor for last item")
 
 
 class PaginationResult(BaseGitLabModel):
@@ -2,10 +2,25 @@
 
 from typing import Literal
 from pydantic import Field, field_validator
-from gitlab_mcp.models.base import BaseGitLabModel, RelativeTime, SafeString
+from gitlab_mcp.models.base import (
+    BaseGitLabModel,
+    EmptyStrToNone,
+    InternedStr,
+    RelativeTime,
+    SafeString,
+)
 from gitlab_mcp.models.misc import UserRef
 
 
+class IssueTimeStatsSummary(BaseGitLabModel):
+    """Time tracking stats embedded in an issue payload."""
+
+    time_estimate: int | None = None
+    total_time_spent: int | None = None
+    human_time_estimate: EmptyStrToNone = None
+    human_total_time_spent: EmptyStrToNone = None
+
+
 class IssueSummary(BaseGitLabModel):
     """issue summary."""
 
@@ -21,17 +36,11 @@ class IssueSummary(BaseGitLabModel):
     updated: RelativeTime = Field(alias="updated_at")
     confidential: bool = False
     weight: int | None = None
-    due_date: str | None = None
+    due_date: EmptyStrToNone = None
     milestone: str | None = None
-    time_stats: dict | None = None
+    time_stats: IssueTimeStatsSummary | None = None
     related_mrs_count: int = Field(0, description="Number of related MRs (detail calls only)")
 
-    @field_validator("description", mode="before")
-    @classmethod
-    def normalize_description(cls, v):
-        """Convert None to empty string."""
-        return "" if v is None else v
-
     @field_validator("milestone", mode="before")
     @classmethod
     def extract_milestone(cls, v):
@@ -41,25 +50,16 @@ class IssueSummary(BaseGitLabModel):
         if isinstance(v, dict):
             return v.get("title")
         if isinstance(v, str):
-            return v
+            return v or None
         # Handle any other type (like MagicMock in tests) as None
         return None
 
     @field_validator("time_stats", mode="before")
     @classmethod
     def extract_time_stats(cls, v):
-        """Extract time tracking stats."""
-        if v is None:
-            return None
-        if isinstance(v, dict):
-            return {
-                "time_estimate": v.get("time_estimate"),
-                "total_time_spent": v.get("total_time_spent"),
-                "human_time_estimate": v.get("human_time_estimate"),
-                "human_total_time_spent": v.get("human_total_time_spent"),
-            }
+        """Keep time tracking stats dicts; the sub-model picks out the fields."""
         # Handle any other type (like MagicMock in tests) as None
-        return None
+        return v if isinstance(v, dict) else None
 
 
 class IssueNote(BaseGitLabModel):
@@ -82,6 +82,8 @@ class IssueNote(BaseGitLabModel):
 class IssueLink(BaseGitLabModel):
     """Link between two issues."""
 
+    __gitlab_trusted__ = True
+
     id: int
     type: str = Field(alias="link_type")
     target_project_id: int
@@ -108,7 +110,7 @@ class RelatedMergeRequest(BaseGitLabModel):
     id: int = Field(description="Merge request ID")
     iid: int = Field(description="Merge request number within project")
     title: str = Field(description="MR title")
-    state: str = Field(description="MR state (opened, closed, merged, locked)")
+    state: InternedStr = Field(description="MR state (opened, closed, merged, locked)")
     url: str = Field(alias="web_url", description="Web URL to view MR")
 
 
@@ -117,9 +119,9 @@ class IssueTimeStats(BaseGitLabModel):
 
     time_estimate: int = Field(0, description="Time estimate in seconds")
     total_time_spent: int = Field(0, description="Total time spent in seconds")
-    human_time_estimate: str | None = Field(
+    human_time_estimate: EmptyStrToNone = Field(
         None, description="Human-readable time estimate from GitLab"
     )
-    human_total_time_spent: str | None = Field(
+    human_total_time_spent: EmptyStrToNone = Field(
         None, description="Human-readable total time spent from GitLab"
     )
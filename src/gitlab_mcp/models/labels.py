@@ -1,27 +1,33 @@
 """Label models."""
 
-from pydantic import Field, field_serializer, field_validator
-from gitlab_mcp.models.base import BaseGitLabModel
+from typing import Annotated
+
+from pydantic import Field, PlainSerializer
+from gitlab_mcp.models.base import BaseGitLabModel, safe_str
+
+# LabelSummary is built with model_construct() (no validation), so its
+# fallbacks are applied on output rather than through SafeString.
+LabelText = Annotated[str | None, PlainSerializer(safe_str, return_type=str)]
+
+
+def _text_color_or_default(v: str | None) -> str:
+    """Fall back to white when GitLab leaves the text color unset."""
+    return v or "#FFFFFF"
+
+
+TextColor = Annotated[str, PlainSerializer(_text_color_or_default, return_type=str)]
 
 
 class LabelSummary(BaseGitLabModel):
     """Label info."""
 
+    __gitlab_trusted__ = True
+
     id: int = Field(description="Unique label identifier")
     name: str = Field(description="Label name")
     color: str = Field(description="Label color (hex code)")
-    description: str | None = Field(default=None, description="Label description")
-    text_color: str = Field(default="#FFFFFF", description="Text color for contrast")
-
-    @field_serializer("description")
-    def serialize_description(self, v: str) -> str:
-        """Ensure description is never None."""
-        return v or ""
-
-    @field_serializer("text_color")
-    def serialize_text_color(self, v: str) -> str:
-        """Ensure text_color has a default."""
-        return v or "#FFFFFF"
+    description: LabelText = Field(default=None, description="Label description")
+    text_color: TextColor = Field(default="#FFFFFF", description="Text color for contrast")
 
 
 class LabelDeleteResult(BaseGitLabModel):
@@ -1,6 +1,8 @@
 """Merge request models."""
 
-from typing import Annotated, Literal, Any
+from functools import cached_property
+from typing import Annotated, Literal, Any, Self
+from gitlab.base import RESTObject
 from pydantic import (
     Field,
     field_validator,
@@ -10,9 +12,12 @@ from pydantic import (
 )
 from gitlab_mcp.models.base import (
     BaseGitLabModel,
+    EmptyStrToNone,
     HtmlCommentFree,
     RelativeTime,
     SafeString,
+    author_username,
+    rest_attrs,
 )
 from gitlab_mcp.models.misc import UserRef
 
@@ -22,6 +27,11 @@ def ensure_string(v: str | None) -> str:
     return "" if v is None else v
 
 
+def pipeline_status(v: Any) -> str | None:
+    """Reduce a head_pipeline payload to its status."""
+    return v.get("status") if type(v) is dict else None
+
+
 class MergeRequestSummary(BaseGitLabModel):
     """merge request summary.
 
@@ -39,30 +49,25 @@ class MergeRequestSummary(BaseGitLabModel):
     updated: RelativeTime = Field(alias="updated_at", description="When last updated (relative)")
     reviewers: list[UserRef] = Field(default_factory=list)
 
-    # Fields for computed properties (extracted in model_validator)
+    # Fields for computed properties (approvals are attached via with_approvals)
     _approvals_required: int = 0
     _approvals_left: int = 0
-    head_pipeline: dict | None = None
+    head_pipeline_status: Annotated[str | None, BeforeValidator(pipeline_status)] = Field(
+        None, alias="head_pipeline", description="Status of the head pipeline"
+    )
     _merge_status: str | None = None
     _detailed_merge_status: str | None = None
 
-    @model_validator(mode="before")
-    @classmethod
-    def extract_approval_data(cls, data: Any) -> Any:
-        """Extract approval info from nested approvals object."""
-        # Only extract if processing an object (not already a dict with extracted data)
-        if not isinstance(data, dict) and hasattr(data, "approvals"):
-            try:
-                approval_obj = data.approvals.get()
-                approvals_required = getattr(approval_obj, "approvals_required", 0)
-                approvals_left = getattr(approval_obj, "approvals_left", 0)
-
-                # Set as attributes for from_attributes extraction
-                data._approvals_required = approvals_required
-                data._approvals_left = approvals_left
-            except (TypeError, AttributeError):
-                pass
-        return data
+    def with_approvals(self, approvals: Any) -> Self:
+        """Attach approval counts fetched separately (e.g. ``mr.approvals.get()``).
+
+        Approvals cost one request per MR, so validation never fetches them;
+        single-MR tools attach them and list tools leave them at 0/0.
+        """
+        self._approvals_required = getattr(approvals, "approvals_required", 0) or 0
+        self._approvals_left = getattr(approvals, "approvals_left", 0) or 0
+        self.__dict__.pop("blockers", None)  # drop a cached value computed without them
+        return self
 
     @computed_field
     @property
@@ -72,18 +77,17 @@ class MergeRequestSummary(BaseGitLabModel):
         return f"{approved}/{self._approvals_required}"
 
     @computed_field
-    @property
+    @cached_property
     def blockers(self) -> list[str]:
-        """Compute reasons blocking merge from pipeline/merge status."""
+        """Compute reasons blocking merge from pipeline/merge status.
+
+        Cached per instance: ready_to_merge reads it again during the same dump.
+        """
         blockers = []
 
         # Check pipeline status
-        if self.head_pipeline:
-            pipeline_status = (
-                self.head_pipeline.get("status") if isinstance(self.head_pipeline, dict) else None
-            )
-            if pipeline_status in ("failed", "running", "pending"):
-                blockers.append(f"Pipeline {pipeline_status}")
+        if self.head_pipeline_status in ("failed", "running", "pending"):
+            blockers.append(f"Pipeline {self.head_pipeline_status}")
 
         # Check merge status for conflicts
         if self._merge_status == "cannot_be_merged":
@@ -108,14 +112,14 @@ class MergeRequestSummary(BaseGitLabModel):
     @property
     def ready_to_merge(self) -> bool:
         """Whether MR can be merged now."""
-        return self.state == "opened" and len(self.blockers) == 0
+        return self.state == "opened" and not self.blockers
 
 
 class MergeRequestDiff(BaseGitLabModel):
     """Single file change in a merge request."""
 
     path: str = Field(alias="new_path", description="File path (new path if renamed)")
-    old_path: str | None = Field(None, description="Original path if renamed")
+    old_path: EmptyStrToNone = Field(None, description="Original path if renamed")
     diff: Annotated[str, BeforeValidator(ensure_string)] = Field(
         default="", description="Unified diff content"
     )
@@ -186,7 +190,7 @@ class ApprovalResult(BaseGitLabModel):
 class ApprovalRule(BaseGitLabModel):
     """Single approval rule."""
 
-    rule_type: str | None = Field(None, description="Type of approval rule")
+    rule_type: EmptyStrToNone = Field(None, description="Type of approval rule")
     eligible_approvers: list[dict] = Field(
         default_factory=list, description="List of eligible approvers"
     )
@@ -208,6 +212,37 @@ class ApprovalStateDetailed(BaseGitLabModel):
         default_factory=list, description="Approval rules still needed", alias="rules"
     )
 
+    @classmethod
+    def from_gitlab(cls, obj: RESTObject | list[RESTObject]) -> Self | list[Self]:
+        """Build from an approvals RESTObject without re-validating approvers.
+
+        Raw JSON goes through from_gitlab_dict(), which validates as usual.
+        """
+        if not isinstance(obj, RESTObject):
+            return super().from_gitlab(obj)
+        attrs = rest_attrs(obj)
+        return cls.model_construct(
+            iid=attrs["iid"],
+            approved=attrs["approved"],
+            approved_by=[_approver_ref(a) for a in attrs.get("approved_by") or ()],
+            approvals_required=attrs.get("approvals_required", 0),
+            approvals_left=attrs.get("approvals_left", 0),
+            # Few rules per MR; validate them so EmptyStrToNone still applies
+            approval_rules_left=[
+                ApprovalRule.model_validate(rule) for rule in attrs.get("rules") or ()
+            ],
+        )
+
+
+def _approver_ref(approver: dict) -> UserRef:
+    """Build a UserRef from an approved_by entry (bare user or {"user": {...}})."""
+    user = approver.get("user", approver)
+    return UserRef.model_construct(
+        id=user.get("id", 0),
+        username=user.get("username", "unknown"),
+        name=user.get("name") or None,
+    )
+
 
 class MergeRequestNote(BaseGitLabModel):
     """Comment (note) on a merge request."""
@@ -228,33 +263,30 @@ class MergeRequestNote(BaseGitLabModel):
         Handles both plain dicts (from API responses) and RESTObjects
         (from python-gitlab, which have no author_id attribute).
         """
-        if isinstance(data, dict):
-            author = data.get("author")
-            if isinstance(author, dict):
-                data = dict(data)
-                data.setdefault("author_id", author.get("id", 0))
-                data["author"] = author.get("username", "unknown")
-            return data
-        # RESTObject: author is a nested dict attribute, author_id doesn't exist
-        author = getattr(data, "author", None)
-        if isinstance(author, dict):
-            return {
-                "id": getattr(data, "id", None),
-                "author_id": author.get("id", 0),
-                "author": author.get("username", "unknown"),
-                "created_at": getattr(data, "created_at", ""),
-                "updated_at": getattr(data, "updated_at", ""),
-                "body": getattr(data, "body", ""),
-                "system": getattr(data, "system", False),
-            }
+        if type(data) is dict:
+            return _note_from_dict(data)
+        if isinstance(data, RESTObject):
+            return _note_from_dict(rest_attrs(data))
         return data
 
+
+def _note_from_dict(data: dict) -> dict:
+    """Flatten a note payload's nested author into author/author_id."""
+    author = data.get("author")
+    if type(author) is not dict:
+        return data
+    data = dict(data)
+    data.setdefault("author_id", author.get("id", 0))
+    data["author"] = author_username(author)
+    return data
+
+
 class MergeRequestVersion(BaseGitLabModel):
     """Version (iteration) of a merge request."""
 
     id: int = Field(description="Version ID")
     created_at: str = Field(description="When created")
-    updated_at: str | None = Field(None, description="When updated")
+    updated_at: EmptyStrToNone = Field(None, description="When updated")
     head_commit_sha: str = Field(description="HEAD commit SHA")
     base_commit_sha: str = Field(description="Base commit SHA")
     start_commit_sha: str = Field(description="Start commit SHA")
@@ -264,7 +296,7 @@ class FileChange(BaseGitLabModel):
     """Single file change with diff stats."""
 
     path: str = Field(alias="new_path", description="File path")
-    old_path: str | None = Field(None, description="Original path if renamed")
+    old_path: EmptyStrToNone = Field(None, description="Original path if renamed")
     status: str = Field(description="Change status: added, modified, deleted, renamed")
     additions: int = Field(description="Lines added")
     deletions: int = Field(description="Lines deleted")
@@ -2,7 +2,7 @@
 
 from typing import Literal
 from pydantic import Field
-from gitlab_mcp.models.base import BaseGitLabModel, RelativeTime
+from gitlab_mcp.models.base import BaseGitLabModel, EmptyStrToNone, RelativeTime
 
 
 class MilestoneSummary(BaseGitLabModel):
@@ -10,10 +10,10 @@ class MilestoneSummary(BaseGitLabModel):
 
     id: int
     title: str
-    description: str | None = Field(default=None, description="Milestone description")
+    description: EmptyStrToNone = Field(default=None, description="Milestone description")
     state: Literal["active", "closed"]
-    due_date: str | None = Field(None, description="Due date (YYYY-MM-DD)")
-    start_date: str | None = Field(None, description="Start date (YYYY-MM-DD)")
+    due_date: EmptyStrToNone = Field(None, description="Due date (YYYY-MM-DD)")
+    start_date: EmptyStrToNone = Field(None, description="Start date (YYYY-MM-DD)")
     url: str = Field(description="Web URL", alias="web_url")
     created: RelativeTime = Field(description="When created (relative)", alias="created_at")
     updated: RelativeTime = Field(description="When last updated (relative)", alias="updated_at")
@@ -36,16 +36,7 @@ class MilestoneBurndownEvent(BaseGitLabModel):
     issue_id: int | None = Field(None, description="Issue ID associated with event")
 
 
-class MilestonePromoteResult(BaseGitLabModel):
+class MilestonePromoteResult(MilestoneSummary):
     """Result of promoting a project milestone to group milestone."""
 
-    id: int
-    title: str
-    description: str | None = Field(default=None, description="Milestone description")
-    state: Literal["active", "closed"]
-    due_date: str | None = Field(None, description="Due date (YYYY-MM-DD)")
-    start_date: str | None = Field(None, description="Start date (YYYY-MM-DD)")
-    url: str = Field(description="Web URL", alias="web_url")
-    created: RelativeTime = Field(description="When created (relative)", alias="created_at")
-    updated: RelativeTime = Field(description="When last updated (relative)", alias="updated_at")
     promoted: bool = Field(description="Whether milestone was promoted to group level")
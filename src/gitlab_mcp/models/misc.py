@@ -1,13 +1,15 @@
 """Miscellaneous models for namespaces, users, iterations."""
 
 from typing import Literal
-from pydantic import Field, field_validator
+from pydantic import Field
 from gitlab_mcp.models.base import (
     BaseGitLabModel,
+    EmptyStrToNone,
+    InternedStr,
+    OptionalInternedStr,
     RelativeTime,
     RelativeTimeOptional,
     SafeString,
-    safe_str,
 )
 
 
@@ -19,7 +21,7 @@ class NamespaceSummary(BaseGitLabModel):
     path: str
     full_path: str
     kind: Literal["user", "group"]
-    description: str | None = None
+    description: EmptyStrToNone = None
 
 
 class UserRef(BaseGitLabModel):
@@ -27,7 +29,7 @@ class UserRef(BaseGitLabModel):
 
     id: int = Field(0, description="User ID")
     username: str = Field(description="Username (login)")
-    name: str | None = Field(None, description="Display name")
+    name: EmptyStrToNone = Field(None, description="Display name")
 
 
 class UserSummary(BaseGitLabModel):
@@ -36,7 +38,7 @@ class UserSummary(BaseGitLabModel):
     id: int
     username: str
     name: str
-    state: str | None = None
+    state: EmptyStrToNone = None
     last_active: RelativeTimeOptional = Field(None, exclude=True, alias="last_activity_on")
 
 
@@ -44,9 +46,9 @@ class EventSummary(BaseGitLabModel):
     """event/activity summary."""
 
     id: int
-    action: str | None = Field(None, exclude=True, alias="action_name")
-    target_type: str | None = None
-    target_title: SafeString = None
+    action: OptionalInternedStr = Field(None, exclude=True, alias="action_name")
+    target_type: OptionalInternedStr = None
+    target_title: SafeString = ""
     author: UserRef | None = None
     created: RelativeTime = Field(exclude=True, alias="created_at")
 
@@ -56,10 +58,10 @@ class IterationSummary(BaseGitLabModel):
 
     id: int
     title: str
-    description: SafeString = None
-    state: str
-    start_date: str | None = None
-    due_date: str | None = None
+    description: SafeString = ""
+    state: InternedStr
+    start_date: EmptyStrToNone = None
+    due_date: EmptyStrToNone = None
     url: str = Field(alias="web_url")
     created: RelativeTime = Field(exclude=True, alias="created_at")
 
@@ -69,9 +71,9 @@ class NamespaceVerification(BaseGitLabModel):
 
     exists: bool = Field(description="Whether the namespace exists")
     id: int | None = Field(None, description="Namespace ID if found")
-    name: str | None = Field(None, description="Namespace name if found")
-    path: str | None = Field(None, description="Namespace path if found")
-    full_path: str | None = Field(None, description="Full path if found")
+    name: EmptyStrToNone = Field(None, description="Namespace name if found")
+    path: EmptyStrToNone = Field(None, description="Namespace path if found")
+    full_path: EmptyStrToNone = Field(None, description="Full path if found")
     kind: Literal["user", "group"] | None = Field(None, description="Namespace kind if found")
-    error: str | None = Field(None, description="Error message if not found")
+    error: EmptyStrToNone = Field(None, description="Error message if not found")
     suggestions: list[dict] | None = Field(None, description="Similar namespaces if requested")
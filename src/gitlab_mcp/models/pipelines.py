@@ -1,8 +1,14 @@
 """Pipeline and job models."""
 
 from typing import Literal
-from pydantic import Field, field_validator, field_serializer
-from gitlab_mcp.models.base import BaseGitLabModel, RelativeTime
+from pydantic import Field, field_validator
+from gitlab_mcp.models.base import (
+    BaseGitLabModel,
+    EmptyStrToNone,
+    InternedStr,
+    RelativeTime,
+    ShortSha,
+)
 
 
 class PipelineSummary(BaseGitLabModel):
@@ -23,7 +29,7 @@ class PipelineSummary(BaseGitLabModel):
         "scheduled",
     ]
     ref: str = Field(description="Branch or tag name")
-    sha: str = Field(description="Commit SHA")
+    sha: ShortSha = Field(description="Commit SHA (first 8 chars)")
     url: str = Field(alias="web_url", description="Web URL to view pipeline")
     created: RelativeTime = Field(alias="created_at", description="When created (relative)")
     updated: RelativeTime = Field(alias="updated_at", description="When last updated (relative)")
@@ -31,15 +37,7 @@ class PipelineSummary(BaseGitLabModel):
     stages: list[str] | list[dict] | None = Field(
         None, description="Stage names or stages breakdown with status and job count"
     )
-    failure_reason: str | None = Field(None, description="Reason if pipeline failed")
-
-    @field_validator("sha", mode="before")
-    @classmethod
-    def truncate_sha(cls, v):
-        """Shorten commit SHA to 8 characters for readability."""
-        if isinstance(v, str) and len(v) > 8:
-            return v[:8]
-        return v
+    failure_reason: EmptyStrToNone = Field(None, description="Reason if pipeline failed")
 
 
 class JobSummary(BaseGitLabModel):
@@ -47,39 +45,31 @@ class JobSummary(BaseGitLabModel):
 
     id: int
     name: str
-    stage: str
-    status: str
+    stage: InternedStr
+    status: InternedStr
     url: str = Field(alias="web_url", description="Web URL to view job")
     duration: float | None = Field(None, description="Job duration in seconds")
     created: RelativeTime = Field(alias="created_at", description="When created (relative)")
-    failure_reason: str | None = Field(None, description="Reason if job failed")
+    failure_reason: EmptyStrToNone = Field(None, description="Reason if job failed")
     retry_count: int = Field(0, description="Number of retries")
     artifacts: list[str] | None = Field(None, description="List of artifact filenames")
 
     @field_validator("artifacts", mode="before")
     @classmethod
     def extract_artifacts(cls, v):
-        """Extract artifact filenames from artifact objects."""
+        """Extract artifact filenames from artifact objects, dropping empty names."""
         if callable(v):
             # from_attributes=True reads the .artifacts manager method, not a list
             return None
         if not v:
             return None
-        if isinstance(v, list) and len(v) > 0 and isinstance(v[0], dict):
-            names = [artifact.get("file_format") or artifact.get("filename") for artifact in v]
+        if isinstance(v, list) and isinstance(v[0], dict):
+            names = (artifact.get("file_format") or artifact.get("filename") for artifact in v)
             return [a for a in names if a] or None
         if isinstance(v, list):
-            return [a for a in v if a is not None]
+            return [a for a in v if a] or None
         return v
 
-    @field_serializer("artifacts")
-    def serialize_artifacts(self, v: list[str] | None) -> list[str] | None:
-        """Remove empty artifact names."""
-        if not v:
-            return None
-        filtered = [a for a in v if a]
-        return filtered if filtered else None
-
 
 class JobLogResult(BaseGitLabModel):
     """Result of retrieving job logs."""
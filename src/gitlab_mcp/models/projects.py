@@ -1,7 +1,40 @@
 """Project models."""
 
-from pydantic import Field, field_validator, field_serializer, computed_field
-from gitlab_mcp.models.base import BaseGitLabModel, relative_time
+from datetime import UTC, datetime, timedelta
+from typing import Annotated, Any
+from pydantic import BeforeValidator, Field, field_validator, computed_field
+from gitlab_mcp.models.base import (
+    BaseGitLabModel,
+    EmptyStrToNone,
+    InternedStr,
+    SafeString,
+    parse_iso,
+    relative_time,
+    utc_now,
+)
+
+_ACCESS_LEVELS = {
+    10: "guest",
+    20: "reporter",
+    30: "developer",
+    40: "maintainer",
+    50: "owner",
+}
+
+_ACTIVE_WINDOW = timedelta(days=30)
+
+
+def activity_datetime(v: Any) -> datetime | None:
+    """Parse a raw last_activity_at timestamp; None if missing or unparsable."""
+    if isinstance(v, datetime):
+        return v if v.tzinfo else v.replace(tzinfo=UTC)
+    if not v or not isinstance(v, str):
+        return None
+    try:
+        dt = parse_iso(v)
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=UTC)
 
 
 class ProjectSummary(BaseGitLabModel):
@@ -10,20 +43,20 @@ class ProjectSummary(BaseGitLabModel):
     id: int
     path_with_namespace: str = Field(alias="path")
     name: str
-    description: str | None = None
+    description: SafeString = ""
     web_url: str = Field(alias="url")
     default_branch: str = "main"
-    visibility: str
+    visibility: InternedStr
     created_at: str = Field(alias="created")
     star_count: int = 0
     forks_count: int = Field(default=0, alias="fork_count")
     last_activity_at: str = "unknown"
     open_issues_count: int = 0
 
-    @field_serializer("description")
-    def serialize_description(self, v: str | None) -> str:
-        """Convert None to empty string for output."""
-        return "" if v is None else v
+    # Raw timestamp behind is_active; last_activity_at itself becomes relative text
+    last_activity: Annotated[datetime | None, BeforeValidator(activity_datetime)] = Field(
+        None, validation_alias="last_activity_at", exclude=True
+    )
 
     @field_validator("default_branch", mode="before")
     @classmethod
@@ -47,15 +80,9 @@ class ProjectSummary(BaseGitLabModel):
     @property
     def is_active(self) -> bool:
         """True if project had activity in last 30 days."""
-        if not self.last_activity_at or self.last_activity_at == "unknown":
-            return False
-        from datetime import datetime, timedelta
-
-        try:
-            activity_date = datetime.fromisoformat(self.last_activity_at.replace("Z", "+00:00"))
-            return datetime.now(activity_date.tzinfo) - activity_date < timedelta(days=30)
-        except (ValueError, AttributeError, TypeError):
+        if self.last_activity is None:
             return False
+        return utc_now() - self.last_activity < _ACTIVE_WINDOW
 
     @computed_field
     @property
@@ -70,19 +97,12 @@ class ProjectMember(BaseGitLabModel):
     username: str
     name: str
     access_level: int | str
-    expires_at: str | None = None
+    expires_at: EmptyStrToNone = None
 
     @field_validator("access_level", mode="before")
     @classmethod
     def convert_access_level(cls, v):
         """Convert numeric access level codes to strings."""
-        access_levels = {
-            10: "guest",
-            20: "reporter",
-            30: "developer",
-            40: "maintainer",
-            50: "owner",
-        }
         if isinstance(v, int):
-            return access_levels.get(v, str(v))
+            return _ACCESS_LEVELS.get(v, str(v))
         return v
@@ -1,7 +1,12 @@
 """Release models."""
 
 from pydantic import Field
-from gitlab_mcp.models.base import BaseGitLabModel, RelativeTime
+from gitlab_mcp.models.base import (
+    BaseGitLabModel,
+    EmptyStrToNone,
+    RelativeTime,
+    RelativeTimeOptional,
+)
 from gitlab_mcp.models.misc import UserRef
 
 
@@ -9,11 +14,11 @@ class ReleaseSummary(BaseGitLabModel):
     """AI-optimized release summary."""
 
     tag_name: str = Field(description="Release tag (e.g., v1.0.0)")
-    name: str | None = None
-    description: str | None = None
+    name: EmptyStrToNone = None
+    description: EmptyStrToNone = None
     author: UserRef | None = None
     created_at: RelativeTime = Field(description="When created")
-    released_at: RelativeTime | None = Field(None, description="When released")
+    released_at: RelativeTimeOptional = Field(None, description="When released")
 
 
 class ReleaseDeleteResult(BaseGitLabModel):
@@ -30,7 +35,7 @@ class ReleaseEvidence(BaseGitLabModel):
     id: int | None = Field(None, description="Evidence ID")
     tag_name: str = Field(description="Release tag name")
     status: str = Field(description="Operation status (e.g., 'created')")
-    evidence_url: str | None = Field(None, description="URL to evidence file")
+    evidence_url: EmptyStrToNone = Field(None, description="URL to evidence file")
 
 
 class ReleaseAssetDownload(BaseGitLabModel):
@@ -46,6 +51,8 @@ class ReleaseAssetDownload(BaseGitLabModel):
 class ReleaseLink(BaseGitLabModel):
     """Release link/asset information."""
 
+    __gitlab_trusted__ = True
+
     id: int = Field(description="Link ID")
     name: str = Field(description="Link name/label")
     url: str = Field(description="Link URL")
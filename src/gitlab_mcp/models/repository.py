@@ -1,9 +1,34 @@
 """Repository and file models."""
 
-from typing import Literal
-from pydantic import Field, field_validator, computed_field
-from gitlab_mcp.models.base import BaseGitLabModel, relative_time, RelativeTime
-from gitlab_mcp.models.misc import UserRef
+from collections.abc import Callable
+from functools import cached_property
+from typing import Annotated, Any, Literal
+from pydantic import BeforeValidator, Field, field_validator, computed_field
+from gitlab_mcp.models.base import (
+    BaseGitLabModel,
+    EmptyStrToNone,
+    RelativeTime,
+    ShortSha,
+    relative_time,
+)
+
+
+# GitLab tree entry types renamed for output; anything else passes through
+_TREE_TYPES = {"tree": "directory", "blob": "file"}
+
+
+def first_parent_sha(v: Any) -> str | None:
+    """Short SHA of the first parent commit, if any."""
+    return v[0][:8] if v else None
+
+
+def _stats_getter(key: str) -> Callable[[Any], int | None]:
+    """Build a validator reading ``key`` from a commit's stats dict."""
+
+    def get(v: Any) -> int | None:
+        return v.get(key) if isinstance(v, dict) else None
+
+    return get
 
 
 class FileSummary(BaseGitLabModel):
@@ -13,17 +38,15 @@ class FileSummary(BaseGitLabModel):
     name: str
     type: Literal["file", "directory"]
     size: int | None = None
-    encoding: str | None = None
-    last_modified: str | None = None
-    last_commit_message: str | None = None
+    encoding: EmptyStrToNone = None
+    last_modified: EmptyStrToNone = None
+    last_commit_message: EmptyStrToNone = None
 
     @field_validator("type", mode="before")
     @classmethod
     def normalize_type(cls, v):
-        """Convert 'tree' to 'directory' for consistency."""
-        if v == "tree":
-            return "directory"
-        return v
+        """Convert 'tree'/'blob' to 'directory'/'file' for consistency."""
+        return _TREE_TYPES.get(v, v)
 
 
 class FileContents(BaseGitLabModel):
@@ -33,7 +56,7 @@ class FileContents(BaseGitLabModel):
     content: str
     size: int
     last_commit: str = Field(description="Short SHA of last commit")
-    syntax_language: str | None = Field(
+    syntax_language: EmptyStrToNone = Field(
         None, description="Language hint for syntax highlighting (from file extension)"
     )
     truncated: bool = Field(False, description="Indicates if content was truncated")
@@ -42,90 +65,51 @@ class FileContents(BaseGitLabModel):
 class CommitSummary(BaseGitLabModel):
     """commit summary."""
 
-    id: str = Field(exclude=True)  # Raw full SHA
-    title: str = Field(exclude=True)  # Raw commit title
+    sha: ShortSha = Field(validation_alias="id")  # Short SHA
+    message: str = Field(alias="title")  # First line of commit message
     author: str = Field(alias="author_name")  # Commit author name
     created: RelativeTime = Field(alias="created_at")  # When created (relative time)
-    parent_ids: list[str] | None = Field(None, exclude=True)  # Raw parent SHAs
-    stats: dict | None = Field(None, exclude=True)  # Raw stats dict
-
-    @computed_field
-    @property
-    def sha(self) -> str:
-        """Short SHA (first 8 chars)."""
-        return self.id[:8]
-
-    @computed_field
-    @property
-    def message(self) -> str:
-        """First line of commit message."""
-        return self.title
-
-    @computed_field
-    @property
-    def parent_sha(self) -> str | None:
-        """Short SHA of parent commit (first 8 chars)."""
-        if self.parent_ids and len(self.parent_ids) > 0:
-            return self.parent_ids[0][:8]
-        return None
-
-    @computed_field
-    @property
-    def files_changed(self) -> int | None:
-        """Number of files changed (if stats fetched)."""
-        if self.stats:
-            return self.stats.get("total")
-        return None
-
-    @computed_field
-    @property
-    def insertions(self) -> int | None:
-        """Lines added (if stats fetched)."""
-        if self.stats:
-            return self.stats.get("additions")
-        return None
-
-    @computed_field
-    @property
-    def deletions(self) -> int | None:
-        """Lines deleted (if stats fetched)."""
-        if self.stats:
-            return self.stats.get("deletions")
-        return None
+    parent_sha: Annotated[str | None, BeforeValidator(first_parent_sha)] = Field(
+        None, validation_alias="parent_ids"
+    )  # Short SHA of first parent
+    # Counts from the stats dict (only present when stats were fetched)
+    files_changed: Annotated[int | None, BeforeValidator(_stats_getter("total"))] = Field(
+        None, validation_alias="stats"
+    )
+    insertions: Annotated[int | None, BeforeValidator(_stats_getter("additions"))] = Field(
+        None, validation_alias="stats"
+    )
+    deletions: Annotated[int | None, BeforeValidator(_stats_getter("deletions"))] = Field(
+        None, validation_alias="stats"
+    )
 
 
 class BranchSummary(BaseGitLabModel):
     """Branch info."""
 
     name: str
-    commit: dict | str  # Raw commit object or SHA
+    commit: dict  # Raw commit object (a bare SHA becomes {"id": sha})
     protected: bool = False
     ahead_count: int | None = Field(None, description="Commits ahead of default branch")
     behind_count: int | None = Field(None, description="Commits behind default branch")
-    last_activity_at: str | None = Field(None, exclude=True)  # ISO datetime
+    last_activity_at: EmptyStrToNone = Field(None, exclude=True)  # ISO datetime
 
     @field_validator("commit", mode="before")
     @classmethod
     def extract_commit_object(cls, v):
         """Extract commit dict or normalize string."""
-        if isinstance(v, dict):
-            return v
-        if isinstance(v, str):
-            return {"id": v}
-        return v
+        return {"id": v} if type(v) is str else v
 
     @computed_field
     @property
     def commit_sha(self) -> str:
         """Short SHA of HEAD commit."""
-        if isinstance(self.commit, dict):
-            return self.commit.get("id", "")[:8]
-        return ""
+        return self.commit.get("id", "")[:8]
 
     @computed_field
-    @property
+    @cached_property
     def last_activity(self) -> str | None:
-        """Relative time of last commit."""
+        """Relative time of last commit (formatted once per instance)."""
         if self.last_activity_at:
             return relative_time(self.last_activity_at)
         return None
@@ -157,7 +141,7 @@ class BranchDeleteResult(BaseGitLabModel):
 
     deleted: bool
     branch: str
-    error: str | None = None
+    error: EmptyStrToNone = None
     protected: bool | None = None
 
 
@@ -187,6 +171,8 @@ class CommitDetails(BaseGitLabModel):
 class FileChange(BaseGitLabModel):
     """A single file change in a commit or diff."""
 
+    __gitlab_trusted__ = True
+
     path: str
     status: str = Field(description="Status: 'new', 'modified', or 'deleted'")
     additions: int
@@ -214,6 +200,8 @@ class BranchDiffResult(BaseGitLabModel):
 class ComparisonCommit(BaseGitLabModel):
     """Commit info in a branch comparison."""
 
+    __gitlab_trusted__ = True
+
     sha: str = Field(description="Short SHA (first 8 chars)")
     message: str
     author: str
@@ -1,5 +1,6 @@
 """Upload and attachment response models."""
 
+from functools import cached_property
 from pydantic import Field, computed_field
 from gitlab_mcp.models.base import BaseGitLabModel
 
@@ -12,10 +13,10 @@ class UploadSummary(BaseGitLabModel):
     alt: str = Field(description="Alt text for markdown link")
 
     @computed_field
-    @property
+    @cached_property
     def filename(self) -> str:
         """Extract filename from markdown link."""
-        return self.markdown.split("(")[-1].rstrip(")")
+        return self.markdown.rpartition("(")[2].rstrip(")")
 
 
 class DownloadResult(BaseGitLabModel):
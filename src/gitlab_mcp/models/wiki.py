@@ -1,8 +1,9 @@
 """Wiki models."""
 
+from datetime import datetime
 from typing import Literal, Any, Annotated
-from pydantic import Field, field_validator, BeforeValidator, PlainSerializer
-from gitlab_mcp.models.base import BaseGitLabModel, relative_time, safe_str, RelativeTimeOptional
+from pydantic import Field, BeforeValidator, PlainSerializer
+from gitlab_mcp.models.base import BaseGitLabModel, safe_str, RelativeTimeOptional
 
 
 def ensure_string(v: Any) -> str:
@@ -18,29 +19,30 @@ def ensure_string(v: Any) -> str:
     return str(v)
 
 
+def iso_datetime(v: Any) -> Any:
+    """Render datetime values as ISO strings; strings and None pass through.
+
+    The RelativeTimeOptional serializer expects ISO text, so a datetime must
+    not be pre-formatted as relative time here.
+    """
+    return v.isoformat() if isinstance(v, datetime) else v
+
+
+# Wiki timestamps may arrive as datetime objects rather than ISO strings
+WikiTimestamp = Annotated[RelativeTimeOptional, BeforeValidator(iso_datetime)]
+
+
 class WikiPageSummary(BaseGitLabModel):
     """wiki page summary (for list views)."""
 
     slug: str = Field(description="URL-safe page identifier")
     title: str
     format: Literal["markdown", "rdoc", "asciidoc"] = "markdown"
-    created: RelativeTimeOptional = Field(None, alias="created_at", description="When created (relative)")
-    updated: RelativeTimeOptional = Field(
+    created: WikiTimestamp = Field(None, alias="created_at", description="When created (relative)")
+    updated: WikiTimestamp = Field(
         None, alias="updated_at", description="When last updated (relative)"
     )
 
-    @field_validator("created", "updated", mode="before")
-    @classmethod
-    def extract_and_format_datetime(cls, v: Any) -> str | None:
-        """Extract datetime value and format as relative time."""
-        if v is None:
-            return None
-        # If already a string (relative time), pass through
-        if isinstance(v, str):
-            return v
-        # Convert datetime object to relative time
-        return relative_time(v)
-
 
 class WikiPageDetail(BaseGitLabModel):
     """Wiki page with full content."""
@@ -49,23 +51,11 @@ class WikiPageDetail(BaseGitLabModel):
     title: str
     content: Annotated[str, BeforeValidator(ensure_string), PlainSerializer(safe_str, return_type=str)]
     format: Literal["markdown", "rdoc", "asciidoc"] = "markdown"
-    created: RelativeTimeOptional = Field(None, alias="created_at", description="When created (relative)")
-    updated: RelativeTimeOptional = Field(
+    created: WikiTimestamp = Field(None, alias="created_at", description="When created (relative)")
+    updated: WikiTimestamp = Field(
         None, alias="updated_at", description="When last updated (relative)"
     )
 
-    @field_validator("created", "updated", mode="before")
-    @classmethod
-    def extract_and_format_datetime(cls, v: Any) -> str | None:
-        """Extract datetime value and format as relative time."""
-        if v is None:
-            return None
-        # If already a string (relative time), pass through
-        if isinstance(v, str):
-            return v
-        # Convert datetime object to relative time
-        return relative_time(v)
-
 
 class WikiPageDeleteResult(BaseGitLabModel):
     """Result of deleting a wiki page."""
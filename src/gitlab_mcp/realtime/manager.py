@@ -18,7 +18,7 @@ from mcp.shared.session import SessionMessage
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Subscription:
     """An active Action Cable subscription."""
 
@@ -161,8 +161,8 @@ def mr_discussions(
         include_all_notes: Show all notes per thread (default false, shows first+last only)
         raw: Return full unstripped markdown bodies (default false)
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
+    project = get_project(project_id, lazy=True)
+    mr = project.mergerequests.get(mr_iid, lazy=True)
     discussions = paginate(mr.discussions, per_page=per_page, page=page)
     if raw:
         return DiscussionDetail.from_gitlab(discussions)
@@ -197,8 +197,8 @@ def list_issue_discussions(
         include_all_notes: Show all notes per thread (default false, shows first+last only)
         raw: Return full unstripped markdown bodies (default false)
     """
-    project = get_project(project_id)
-    issue = project.issues.get(issue_iid)
+    project = get_project(project_id, lazy=True)
+    issue = project.issues.get(issue_iid, lazy=True)
     discussions = paginate(issue.discussions, per_page=per_page, page=page)
     if raw:
         return DiscussionDetail.from_gitlab(discussions)
@@ -222,8 +222,8 @@ def get_mr_discussion(
         mr_iid: Merge request number
         discussion_id: Discussion ID
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
+    project = get_project(project_id, lazy=True)
+    mr = project.mergerequests.get(mr_iid, lazy=True)
     discussion = mr.discussions.get(discussion_id)
     return DiscussionDetail.from_gitlab(discussion)
 
@@ -258,8 +258,8 @@ def create_merge_request_thread(
             - old_line: line number in base version
             - new_line: line number in head version
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
+    project = get_project(project_id, lazy=True)
+    mr = project.mergerequests.get(mr_iid, lazy=True)
 
     data: dict[str, Any] = {"body": body}
     if position:
@@ -292,15 +292,14 @@ def resolve_merge_request_thread(
         discussion_id: Discussion ID
         resolved: True to resolve, False to unresolve
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
-    discussion = mr.discussions.get(discussion_id)
+    project = get_project(project_id, lazy=True)
+    mr = project.mergerequests.get(mr_iid, lazy=True)
+    discussion = mr.discussions.get(discussion_id, lazy=True)
 
+    # The PUT response carries the updated discussion, and save() loads it
+    # into the object, so no follow-up GET is needed
     discussion.resolved = resolved
     discussion.save()
-
-    # Refresh to get updated details
-    discussion = mr.discussions.get(discussion_id)
     return DiscussionSummary.from_gitlab(discussion)
 
 
@@ -325,8 +324,8 @@ def create_merge_request_note(
         mr_iid: Merge request number
         body: Comment text (markdown supported)
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
+    project = get_project(project_id, lazy=True)
+    mr = project.mergerequests.get(mr_iid, lazy=True)
     note = mr.notes.create({"body": body})
     return NoteSummary.from_gitlab(note)
 
@@ -354,8 +353,8 @@ def update_merge_request_note(
         note_id: Note ID to edit
         body: Updated comment text (markdown supported)
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
+    project = get_project(project_id, lazy=True)
+    mr = project.mergerequests.get(mr_iid, lazy=True)
     note = mr.notes.get(note_id, lazy=True)
 
     note.body = body
@@ -384,8 +383,8 @@ def delete_merge_request_note(
         mr_iid: Merge request number
         note_id: Note ID to delete
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
+    project = get_project(project_id, lazy=True)
+    mr = project.mergerequests.get(mr_iid, lazy=True)
 
     logger.warning(f"Deleting note {note_id} from merge request !{mr_iid} in project {project_id}")
     mr.notes.delete(note_id)
@@ -418,8 +417,8 @@ def create_issue_note(
         issue_iid: Issue number
         body: Comment text (markdown supported)
     """
-    project = get_project(project_id)
-    issue = project.issues.get(issue_iid)
+    project = get_project(project_id, lazy=True)
+    issue = project.issues.get(issue_iid, lazy=True)
     note = issue.notes.create({"body": body})
     return NoteSummary.from_gitlab(note)
 
@@ -447,8 +446,8 @@ def update_issue_note(
         note_id: Note ID to edit
         body: Updated comment text (markdown supported)
     """
-    project = get_project(project_id)
-    issue = project.issues.get(issue_iid)
+    project = get_project(project_id, lazy=True)
+    issue = project.issues.get(issue_iid, lazy=True)
     note = issue.notes.get(note_id, lazy=True)
 
     note.body = body
@@ -479,8 +478,8 @@ def create_merge_request_discussion_note(
         discussion_id: Discussion ID to reply to
         body: Reply text (markdown supported)
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
+    project = get_project(project_id, lazy=True)
+    mr = project.mergerequests.get(mr_iid, lazy=True)
     discussion = mr.discussions.get(discussion_id, lazy=True)
     note = discussion.notes.create({"body": body})
     return NoteSummary.from_gitlab(note)
@@ -511,8 +510,8 @@ def update_merge_request_discussion_note(
         note_id: Note ID to edit
         body: Updated reply text (markdown supported)
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
+    project = get_project(project_id, lazy=True)
+    mr = project.mergerequests.get(mr_iid, lazy=True)
     discussion = mr.discussions.get(discussion_id, lazy=True)
     note = discussion.notes.get(note_id, lazy=True)
 
@@ -544,8 +543,8 @@ def delete_merge_request_discussion_note(
         discussion_id: Discussion ID
         note_id: Note ID to delete
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
+    project = get_project(project_id, lazy=True)
+    mr = project.mergerequests.get(mr_iid, lazy=True)
     discussion = mr.discussions.get(discussion_id, lazy=True)
 
     logger.warning(
@@ -595,12 +594,4 @@ def create_note(
             - old_line: line number in base version
             - new_line: line number in head version
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
-
-    data: dict[str, Any] = {"body": body}
-    if position:
-        data["position"] = position
-
-    discussion = mr.discussions.create(data)
-    return DiscussionSummary.from_gitlab(discussion)
+    return create_merge_request_thread(project_id, mr_iid, body, position)
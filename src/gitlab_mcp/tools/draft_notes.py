@@ -1,5 +1,7 @@
 """Draft notes tools for merge requests."""
 
+import gitlab
+
 from gitlab_mcp.server import mcp
 from gitlab_mcp.client import get_project
 from gitlab_mcp.models import (
@@ -26,8 +28,8 @@ def list_draft_notes(project_id: str, mr_iid: int) -> list[DraftNoteSummary]:
         project_id: Project ID or path (e.g., "mygroup/myproject")
         mr_iid: Merge request number within the project
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
+    project = get_project(project_id, lazy=True)
+    mr = project.mergerequests.get(mr_iid, lazy=True)
     draft_notes = mr.draft_notes.list()
     return DraftNoteSummary.from_gitlab(draft_notes)
 
@@ -47,8 +49,8 @@ def get_draft_note(project_id: str, mr_iid: int, draft_note_id: int) -> DraftNot
         mr_iid: Merge request number
         draft_note_id: Draft note ID
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
+    project = get_project(project_id, lazy=True)
+    mr = project.mergerequests.get(mr_iid, lazy=True)
     note = mr.draft_notes.get(draft_note_id)
     return DraftNoteSummary.from_gitlab(note)
 
@@ -76,8 +78,8 @@ def create_draft_note(
         note: Draft note text (markdown supported)
         in_reply_to_discussion_id: Optional discussion ID to reply to
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
+    project = get_project(project_id, lazy=True)
+    mr = project.mergerequests.get(mr_iid, lazy=True)
     data: dict[str, str | int] = {"body": note}
     if in_reply_to_discussion_id:
         data["in_reply_to_discussion_id"] = in_reply_to_discussion_id
@@ -108,8 +110,8 @@ def update_draft_note(
         draft_note_id: Draft note ID to update
         note: New draft note text (markdown supported)
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
+    project = get_project(project_id, lazy=True)
+    mr = project.mergerequests.get(mr_iid, lazy=True)
     draft_note = mr.draft_notes.get(draft_note_id)
     draft_note.body = note
     draft_note.save()
@@ -133,8 +135,8 @@ def delete_draft_note(project_id: str, mr_iid: int, draft_note_id: int) -> Draft
         mr_iid: Merge request number
         draft_note_id: Draft note ID to delete
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
+    project = get_project(project_id, lazy=True)
+    mr = project.mergerequests.get(mr_iid, lazy=True)
     mr.draft_notes.delete(draft_note_id)
     return DraftNoteDeleteResult.model_validate({"deleted": True, "draft_note_id": draft_note_id})
 
@@ -160,8 +162,8 @@ def publish_draft_note(
         mr_iid: Merge request number
         draft_note_id: Draft note ID to publish
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
+    project = get_project(project_id, lazy=True)
+    mr = project.mergerequests.get(mr_iid, lazy=True)
     draft_note = mr.draft_notes.get(draft_note_id)
     draft_note.publish()
     return DraftNotePublishResult.model_validate({"published": True, "draft_note_id": draft_note_id})
@@ -183,7 +185,16 @@ def bulk_publish_draft_notes(project_id: str, mr_iid: int) -> BulkPublishDraftNo
         project_id: Project ID or path
         mr_iid: Merge request number
     """
-    project = get_project(project_id)
-    mr = project.mergerequests.get(mr_iid)
-    mr.publish_all_draft_notes()
+    project = get_project(project_id, lazy=True)
+    mr = project.mergerequests.get(mr_iid, lazy=True)
+    try:
+        mr.draft_notes.bulk_publish()
+    except gitlab.exceptions.GitlabHttpError as e:
+        if e.response_code != 404:
+            raise
+        # No bulk_publish endpoint on this GitLab: publish each draft in order.
+        # Fetch every page first, since each publish deletes a draft and would
+        # shift the offsets of pages not yet read.
+        for note in mr.draft_notes.list(get_all=True):
+            note.publish()
     return BulkPublishDraftNotesResult.model_validate({"published_all": True, "merge_request_iid": mr_iid})
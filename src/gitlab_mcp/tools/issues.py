@@ -43,7 +43,7 @@ def get_issue(project_id: str, issue_iid: int) -> IssueSummary:
         project_id: Project ID or path (e.g., "mygroup/myproject")
         issue_iid: Issue number within the project
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     issue = project.issues.get(issue_iid)
     return IssueSummary.from_gitlab(issue)
 
@@ -79,7 +79,7 @@ def list_issues(
         order_by: Sort by field: created_at, updated_at, priority, label_priority
         sort: Sort direction: asc or desc (default: desc)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
 
     # Build filters
     filters = build_filters(
@@ -137,7 +137,7 @@ def create_issue(
         weight: Issue weight (for issue boards)
         due_date: Due date in YYYY-MM-DD format
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     data: dict[str, Any] = {"title": title, "description": description}
     if labels:
         data["labels"] = labels
@@ -188,7 +188,7 @@ def update_issue(
         weight: Issue weight (for issue boards)
         due_date: Due date in YYYY-MM-DD format
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     issue = project.issues.get(issue_iid)
     if title:
         issue.title = title
@@ -229,7 +229,7 @@ def add_issue_comment(
         issue_iid: Issue number
         body: Comment text (markdown supported)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     issue = project.issues.get(issue_iid)
     note = issue.notes.create({"body": body})
     return IssueNote.from_gitlab(note)
@@ -251,7 +251,7 @@ def delete_issue(project_id: str, issue_iid: int) -> IssueDeleteResult:
         project_id: Project ID or path
         issue_iid: Issue number
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     issue = project.issues.get(issue_iid)
     issue.delete()
     return IssueDeleteResult.model_validate({"status": "deleted", "issue_iid": issue_iid})
@@ -280,7 +280,7 @@ def list_issue_links(project_id: str, issue_iid: int) -> list[IssueLink]:
         project_id: Project ID or path
         issue_iid: Issue number
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     issue = project.issues.get(issue_iid)
     links = issue.links.list()
     return IssueLink.from_gitlab(links)
@@ -295,7 +295,7 @@ def get_issue_link(project_id: str, issue_iid: int, link_id: int) -> IssueLink:
         issue_iid: Issue number
         link_id: Link ID
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     issue = project.issues.get(issue_iid)
     links = issue.links.list()
     link = next((lnk for lnk in links if lnk.id == link_id), None)
@@ -329,7 +329,7 @@ def create_issue_link(
         target_issue_iid: Target issue number
         link_type: Type of link: relates_to, blocks, is_blocked_by
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     issue = project.issues.get(issue_iid)
     target_project = get_project(target_project_id)
     data: dict[str, Any] = {
@@ -358,7 +358,7 @@ def delete_issue_link(project_id: str, issue_iid: int, link_id: int) -> IssueLin
         issue_iid: Issue number
         link_id: Link ID to delete
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     issue = project.issues.get(issue_iid)
     links = issue.links.list()
     link = next((lnk for lnk in links if lnk.id == link_id), None)
@@ -376,7 +376,7 @@ def list_related_merge_requests(project_id: str, issue_iid: int) -> list[Related
         project_id: Project ID or path
         issue_iid: Issue number
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     issue = project.issues.get(issue_iid)
     mrs = issue.related_merge_requests()
     return [RelatedMergeRequest.model_validate(m) for m in mrs]
@@ -401,7 +401,7 @@ def add_time_spent(project_id: str, issue_iid: int, duration: str) -> IssueTimeS
         issue_iid: Issue number
         duration: Duration format - examples: 1h, 30m, 1h30m, 2d, 1w3d2h
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     issue = project.issues.get(issue_iid)
     issue.add_spent_time(duration)
     stats = issue.time_stats()
@@ -416,7 +416,7 @@ def get_time_stats(project_id: str, issue_iid: int) -> IssueTimeStats:
         project_id: Project ID or path
         issue_iid: Issue number
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     issue = project.issues.get(issue_iid)
     stats = issue.time_stats()
     return IssueTimeStats.model_validate(stats)
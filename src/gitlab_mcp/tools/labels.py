@@ -1,9 +1,10 @@
 """Label tools."""
 
+from gitlab.utils import EncodedId
 from gitlab_mcp.server import mcp
-from gitlab_mcp.client import get_project
+from gitlab_mcp.client import get_project, resolve_project_id
 from gitlab_mcp.models import LabelSummary, LabelDeleteResult, LabelSubscriptionResult
-from gitlab_mcp.utils.pagination import paginate
+from gitlab_mcp.utils.pagination import paginate_json
 from gitlab_mcp.utils.query import build_filters
 from gitlab_mcp.utils.validation import validate_color
 
@@ -27,14 +28,13 @@ def list_labels(
         per_page: Items per page (max 100)
         search: Search labels by name
     """
-    project = get_project(project_id)
     filters = build_filters(search=search)
-    labels = paginate(
-        project.labels,
+    labels = paginate_json(
+        f"/projects/{EncodedId(resolve_project_id(project_id))}/labels",
         per_page=per_page,
         **filters,
     )
-    return LabelSummary.from_gitlab(labels)
+    return LabelSummary.from_gitlab_dict(labels)
 
 
 @mcp.tool(
@@ -51,7 +51,7 @@ def get_label(project_id: str, label_id: int) -> LabelSummary:
         project_id: Project ID or path
         label_id: Label ID
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     label = project.labels.get(label_id)
     return LabelSummary.from_gitlab(label)
 
@@ -81,7 +81,7 @@ def create_label(
         description: Label description
         priority: Label priority (lower number = higher priority)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     validated_color = validate_color(color)
     data: dict[str, str | int] = {"name": name, "color": f"#{validated_color}"}
     if description:
@@ -117,7 +117,7 @@ def update_label(
         color: New color (hex code, leave empty to keep current)
         description: New description (leave empty to keep current)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     label = project.labels.get(label_id)
     data = {}
     if name:
@@ -150,7 +150,7 @@ def delete_label(project_id: str, label_id: int) -> LabelDeleteResult:
         project_id: Project ID or path
         label_id: Label ID
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     project.labels.delete(label_id)
     return LabelDeleteResult.model_validate({"id": label_id, "deleted": True})
 
@@ -173,7 +173,7 @@ def promote_label_to_group(project_id: str, label_name: str) -> LabelSummary:
         project_id: Project ID or path
         label_name: Name of the label to promote
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     # Get label by name
     labels = project.labels.list(search=label_name, get_all=False)
     label = next((lbl for lbl in labels if lbl.name == label_name), None)
@@ -201,7 +201,7 @@ def subscribe_to_label(project_id: str, label_name: str) -> LabelSubscriptionRes
         project_id: Project ID or path
         label_name: Name of the label to subscribe to
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     # Get label by name
     labels = project.labels.list(search=label_name, get_all=False)
     label = next((lbl for lbl in labels if lbl.name == label_name), None)
@@ -233,7 +233,7 @@ def unsubscribe_from_label(project_id: str, label_name: str) -> LabelSubscriptio
         project_id: Project ID or path
         label_name: Name of the label to unsubscribe from
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     # Get label by name
     labels = project.labels.list(search=label_name, get_all=False)
     label = next((lbl for lbl in labels if lbl.name == label_name), None)
@@ -36,9 +36,9 @@ def get_merge_request(project_id: str, merge_request_iid: int) -> MergeRequestSu
         project_id: Project ID or path (e.g., "mygroup/myproject")
         merge_request_iid: MR number within the project
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     mr = project.mergerequests.get(merge_request_iid)
-    return MergeRequestSummary.from_gitlab(mr)
+    return MergeRequestSummary.from_gitlab(mr).with_approvals(mr.approvals.get())
 
 
 @mcp.tool(
@@ -78,7 +78,7 @@ def list_merge_requests(
         order_by: Sort by field: created_at, updated_at, title
         sort: Sort direction: asc or desc (default desc)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
 
     # Build filters
     filters = build_filters(
@@ -143,7 +143,7 @@ def create_merge_request(
         labels: List of label names to apply
         milestone_id: Milestone ID to assign
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     data: dict[str, Any] = {
         "source_branch": source_branch,
         "target_branch": target_branch,
@@ -161,6 +161,7 @@ def create_merge_request(
         data["milestone_id"] = milestone_id
 
     mr = project.mergerequests.create(data)
+    # A new MR has no approvals yet, so skip the extra approvals request
     return MergeRequestSummary.from_gitlab(mr)
 
 
@@ -193,7 +194,7 @@ def merge_merge_request(
         squash_commit_message: Custom squash commit message
         should_remove_source_branch: Delete source branch after merge
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     mr = project.mergerequests.get(merge_request_iid)
 
     # Use should_remove_source_branch if provided, otherwise fall back to delete_source_branch for backwards compatibility
@@ -211,7 +212,7 @@ def merge_merge_request(
     mr.merge(**merge_kwargs)  # type: ignore[arg-type]
     # Refresh to get updated state
     mr = project.mergerequests.get(merge_request_iid)
-    return MergeRequestSummary.from_gitlab(mr)
+    return MergeRequestSummary.from_gitlab(mr).with_approvals(mr.approvals.get())
 
 
 @mcp.tool(
@@ -239,7 +240,7 @@ def get_merge_request_diff(
     """
     from fnmatch import fnmatch
 
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     mr = project.mergerequests.get(merge_request_iid)
     changes = mr.changes()
 
@@ -303,7 +304,7 @@ def summarize_merge_request_changes(
     Returns:
         Summary containing files changed, additions, deletions, and per-file details
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     mr = project.mergerequests.get(mr_iid)
     changes = mr.changes()
 
@@ -357,7 +358,7 @@ def approve_merge_request(project_id: str, merge_request_iid: int) -> ApprovalRe
         project_id: Project ID or path
         merge_request_iid: MR number
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     mr = project.mergerequests.get(merge_request_iid)
     mr.approve()
     return ApprovalResult.model_validate({"approved": True, "merge_request_iid": merge_request_iid})
@@ -379,7 +380,7 @@ def unapprove_merge_request(project_id: str, merge_request_iid: int) -> Approval
         project_id: Project ID or path
         merge_request_iid: MR number
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     mr = project.mergerequests.get(merge_request_iid)
     mr.unapprove()
     return ApprovalResult.model_validate({"approved": False, "merge_request_iid": merge_request_iid})
@@ -414,7 +415,7 @@ def update_merge_request(
         labels: List of label names to assign
         assignee_ids: List of assignee user IDs
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     mr = project.mergerequests.get(mr_iid)
 
     # Update attributes directly on the MR object
@@ -432,7 +433,7 @@ def update_merge_request(
     mr.save()
     # Refresh to get updated state
     mr = project.mergerequests.get(mr_iid)
-    return MergeRequestSummary.from_gitlab(mr)
+    return MergeRequestSummary.from_gitlab(mr).with_approvals(mr.approvals.get())
 
 
 @mcp.tool(
@@ -449,7 +450,7 @@ def get_merge_request_approval_state(project_id: str, mr_iid: int) -> ApprovalSt
         project_id: Project ID or path
         mr_iid: MR number
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     mr = project.mergerequests.get(mr_iid)
     approvals = mr.approvals.get()
     return ApprovalStateDetailed.from_gitlab(approvals)
@@ -474,7 +475,7 @@ def get_merge_request_notes(
         mr_iid: MR number
         limit: Maximum number of notes to return
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     mr = project.mergerequests.get(mr_iid)
     notes = mr.notes.list(per_page=limit)
     return MergeRequestNote.from_gitlab(notes)
@@ -499,7 +500,7 @@ def get_merge_request_note(
         mr_iid: MR number
         note_id: Note ID
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     mr = project.mergerequests.get(mr_iid)
     note = mr.notes.get(note_id)
     return MergeRequestNote.from_gitlab(note)
@@ -524,7 +525,7 @@ def list_merge_request_diffs(
         mr_iid: MR number
         limit: Maximum number of diffs to return
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     mr = project.mergerequests.get(mr_iid)
     changes = mr.changes()
     changes_list = changes.get("changes", []) if isinstance(changes, dict) else []
@@ -546,7 +547,7 @@ def list_merge_request_versions(project_id: str, mr_iid: int) -> list[MergeReque
         project_id: Project ID or path
         mr_iid: MR number
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     mr = project.mergerequests.get(mr_iid)
     versions = mr.diffs.list()
     return [MergeRequestVersion.model_validate(v.attributes) for v in versions]
@@ -571,7 +572,7 @@ def get_merge_request_version(
         mr_iid: MR number
         version_id: Version ID
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     mr = project.mergerequests.get(mr_iid)
     version = mr.diffs.get(version_id)
     return MergeRequestVersion.model_validate(version.attributes)
@@ -594,7 +595,7 @@ def get_merge_request_diffs(
         project_id: Project ID or path
         mr_iid: MR number
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     mr = project.mergerequests.get(mr_iid)
     changes = mr.changes()
     changes_list = changes.get("changes", []) if isinstance(changes, dict) else []
@@ -1,8 +1,8 @@
 """Milestone tools."""
 
-from typing import Any
+from gitlab.utils import EncodedId
 from gitlab_mcp.server import mcp
-from gitlab_mcp.client import get_project
+from gitlab_mcp.client import get_project, resolve_project_id
 from gitlab_mcp.models import (
     MilestoneSummary,
     IssueSummary,
@@ -11,7 +11,7 @@ from gitlab_mcp.models import (
     MilestoneBurndownEvent,
     MilestonePromoteResult,
 )
-from gitlab_mcp.utils.pagination import paginate
+from gitlab_mcp.utils.pagination import paginate_json
 from gitlab_mcp.utils.query import build_filters, build_sort
 from gitlab_mcp.utils.validation import validate_date
 
@@ -35,16 +35,15 @@ def list_milestones(
         order_by: Sort by field (created_at, updated_at, due_date, title)
         sort: Sort direction: asc or desc (default desc)
     """
-    project = get_project(project_id)
     filters = build_filters(state=state, search=search)
     sort_params = build_sort(order_by=order_by, sort=sort)
-    milestones = paginate(
-        project.milestones,
+    milestones = paginate_json(
+        f"/projects/{EncodedId(resolve_project_id(project_id))}/milestones",
         per_page=per_page,
         **filters,
         **sort_params,
     )
-    return MilestoneSummary.from_gitlab(milestones)
+    return MilestoneSummary.from_gitlab_dict(milestones)
 
 
 @mcp.tool(annotations={"title": "Get Milestone", "readOnlyHint": True, "openWorldHint": True})
@@ -55,7 +54,7 @@ def get_milestone(project_id: str, milestone_id: int) -> MilestoneSummary:
         project_id: Project ID or path
         milestone_id: Milestone ID
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     milestone = project.milestones.get(milestone_id)
     return MilestoneSummary.from_gitlab(milestone)
 
@@ -85,7 +84,7 @@ def create_milestone(
         due_date: Due date in YYYY-MM-DD format
         start_date: Start date in YYYY-MM-DD format
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     data = {"title": title}
     if description:
         data["description"] = description
@@ -126,7 +125,7 @@ def edit_milestone(
         start_date: New start date in YYYY-MM-DD format (leave empty to keep current)
         state_event: "close" or "activate" to change state
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     milestone = project.milestones.get(milestone_id)
     if title:
         milestone.title = title
@@ -160,7 +159,7 @@ def delete_milestone(project_id: str, milestone_id: int) -> MilestoneDeleteResul
         project_id: Project ID or path
         milestone_id: Milestone ID
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     project.milestones.delete(milestone_id)
     return MilestoneDeleteResult.model_validate({"success": True, "message": f"Milestone {milestone_id} deleted"})
 
@@ -186,7 +185,7 @@ def get_milestone_issues(
         order_by: Sort by field (created_at, updated_at, priority, due_date, title)
         sort: Sort direction: asc or desc (default desc)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     milestone = project.milestones.get(milestone_id)
     filters = build_filters(state=state)
     sort_params = build_sort(order_by=order_by, sort=sort)
@@ -220,7 +219,7 @@ def get_milestone_merge_requests(
         order_by: Sort by field (created_at, updated_at, title)
         sort: Sort direction: asc or desc (default desc)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     milestone = project.milestones.get(milestone_id)
     filters = build_filters(state=state)
     sort_params = build_sort(order_by=order_by, sort=sort)
@@ -246,7 +245,7 @@ def get_milestone_burndown_events(
         project_id: Project ID or path
         milestone_id: Milestone ID
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     milestone = project.milestones.get(milestone_id)
     path = f"{milestone.manager.path}/{milestone.encoded_id}/burndown_events"
     raw_events = project.manager.gitlab.http_list(path, get_all=True)
@@ -275,7 +274,7 @@ def get_milestone_issue(
         milestone_id: Milestone ID
         issue_iid: Issue number within the project
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     milestone = project.milestones.get(milestone_id)
     issues = list(milestone.issues())
     for issue in issues:
@@ -300,7 +299,7 @@ def promote_milestone(project_id: str, milestone_id: int) -> MilestonePromoteRes
         project_id: Project ID or path
         milestone_id: Milestone ID to promote
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     milestone = project.milestones.get(milestone_id)
     milestone.promote()
     # Refresh to get updated state
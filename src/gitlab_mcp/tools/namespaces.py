@@ -1,6 +1,6 @@
 """Namespace tools for GitLab."""
 
-from typing import Any, cast
+from typing import Any
 from gitlab_mcp.server import mcp
 from gitlab_mcp.client import get_client
 from gitlab_mcp.utils.pagination import paginate
@@ -81,16 +81,13 @@ def _get_namespace_info(path: str) -> dict[str, Any] | None:
         namespace = client.namespaces.get(path, lazy=True)
         namespace.reload()
 
-        return cast(
-            dict[str, Any],
-            {
-                "id": namespace.id,
-                "name": namespace.name,
-                "path": namespace.path,
-                "full_path": namespace.full_path,
-                "kind": namespace.kind,
-            },
-        )
+        return {
+            "id": namespace.id,
+            "name": namespace.name,
+            "path": namespace.path,
+            "full_path": namespace.full_path,
+            "kind": namespace.kind,
+        }
     except Exception:
         return None
 
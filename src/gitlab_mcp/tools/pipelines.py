@@ -37,7 +37,7 @@ def list_pipelines(
         order_by: Sort by field (id, status, ref, updated_at, user_id)
         sort: Sort direction: asc or desc (default: desc)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
 
     # Build filters using the utility, passing through pipeline-specific filters
     filters = build_filters(
@@ -74,7 +74,7 @@ def get_pipeline(project_id: str, pipeline_id: int, include_stages: bool = True)
         pipeline_id: Pipeline ID
         include_stages: Include stages breakdown with status and job counts (default: True)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     pipeline = project.pipelines.get(pipeline_id)
     return PipelineSummary.from_gitlab(pipeline)
 
@@ -102,7 +102,7 @@ def create_pipeline(
         variables: Pipeline variables as key-value pairs (e.g., {"VAR_NAME": "value"})
         description: Pipeline description (if supported by API)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     payload: dict[str, str | list[dict[str, str]]] = {"ref": ref}
 
     # Add variables if provided, formatted as GitLab API expects
@@ -134,7 +134,7 @@ def retry_pipeline(project_id: str, pipeline_id: int) -> PipelineSummary:
     """
     # Endpoint verified: POST /projects/:id/pipelines/:pipeline_id/retry
     # https://docs.gitlab.com/ee/api/pipelines.html
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     pipeline = project.pipelines.get(pipeline_id)
 
     # Check if pipeline already succeeded
@@ -165,7 +165,7 @@ def cancel_pipeline(project_id: str, pipeline_id: int) -> PipelineSummary:
         project_id: Project ID or path
         pipeline_id: Pipeline ID to cancel
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     pipeline = project.pipelines.get(pipeline_id)
 
     # Check if pipeline already completed
@@ -201,7 +201,7 @@ def list_pipeline_jobs(
         per_page: Items per page (default 50, max 100)
         status: Filter by job status (created, pending, running, success, failed, canceled, skipped, manual)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     pipeline = project.pipelines.get(pipeline_id)
 
     # Build filters
@@ -231,7 +231,7 @@ def get_pipeline_job(project_id: str, job_id: int) -> JobSummary:
         project_id: Project ID or path
         job_id: Job ID
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     job = project.jobs.get(job_id)
     return JobSummary.from_gitlab(job)
 
@@ -262,7 +262,7 @@ def get_job_log(
         For running jobs, this returns the log content available at the time of
         the request. Poll periodically for updates on in-progress jobs.
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     job = project.jobs.get(job_id)
 
     # Get full log (trace() returns bytes)
@@ -314,7 +314,7 @@ def play_pipeline_job(project_id: str, job_id: int) -> JobSummary:
         project_id: Project ID or path
         job_id: Job ID to play/trigger
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     job = project.jobs.get(job_id)
 
     # Check if job is manual or skipped
@@ -344,7 +344,7 @@ def retry_pipeline_job(project_id: str, job_id: int) -> JobSummary:
         project_id: Project ID or path
         job_id: Job ID to retry
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     job = project.jobs.get(job_id)
 
     # Check if job failed
@@ -374,7 +374,7 @@ def cancel_pipeline_job(project_id: str, job_id: int) -> JobSummary:
         project_id: Project ID or path
         job_id: Job ID to cancel
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     job = project.jobs.get(job_id)
 
     # Check if job already completed
@@ -410,7 +410,7 @@ def list_pipeline_trigger_jobs(
         per_page: Items per page (default 50, max 100)
         status: Filter by job status (created, pending, running, success, failed, canceled, skipped, manual)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     pipeline = project.pipelines.get(pipeline_id)
 
     # Build filters
@@ -99,7 +99,7 @@ def list_project_members(
     Returns:
         List of project members with access levels
     """
-    project = _get_project(project_id)
+    project = _get_project(project_id, lazy=True)
 
     filters: dict[str, Any] = {}
     if search:
@@ -187,7 +187,7 @@ def get_project_events(
     Returns:
         List of recent project events with AI-friendly summaries
     """
-    project = _get_project(project_id)
+    project = _get_project(project_id, lazy=True)
 
     filters = {}
     if action:
@@ -285,7 +285,7 @@ def fork_repository(
     """
     import time
 
-    project = _get_project(project_id)
+    project = _get_project(project_id, lazy=True)
     fork_data = {"namespace": namespace}
     if visibility:
         fork_data["visibility"] = visibility
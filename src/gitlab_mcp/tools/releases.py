@@ -5,8 +5,8 @@ import httpx
 from gitlab_mcp.server import mcp
 from gitlab_mcp.client import get_project
 from gitlab_mcp.config import get_config
-from gitlab_mcp.models import ReleaseSummary
 from gitlab_mcp.models.releases import (
+    ReleaseSummary,
     ReleaseDeleteResult,
     ReleaseEvidence,
     ReleaseAssetDownload,
@@ -38,7 +38,7 @@ def list_releases(
         order_by: Sort by field (released_at, created_at)
         sort: Sort direction (asc, desc)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     filters = build_sort(order_by=order_by, sort=sort)
     releases = paginate(
         project.releases,
@@ -62,7 +62,7 @@ def get_release(project_id: str, tag_name: str) -> ReleaseSummary:
         project_id: Project ID or path
         tag_name: Release tag name
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     release = project.releases.get(tag_name)
     return ReleaseSummary.from_gitlab(release)
 
@@ -92,7 +92,7 @@ def create_release(
         description: Release description (markdown supported)
         ref: Commit SHA, another tag, or branch name (defaults to tag_name)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     data = {"tag_name": tag_name}
     if name:
         data["name"] = name
@@ -127,7 +127,7 @@ def update_release(
         name: New release name (leave empty to keep current)
         description: New description (leave empty to keep current)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     release = project.releases.get(tag_name)
     if name:
         release.name = name
@@ -157,7 +157,7 @@ def delete_release(project_id: str, tag_name: str, keep_tag: bool = False) -> Re
         tag_name: Release tag name
         keep_tag: If True, delete release but preserve the git tag (default: False)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     project.releases.delete(tag_name, keep_tag=keep_tag)
     return ReleaseDeleteResult.model_validate({"status": "deleted", "tag_name": tag_name, "keep_tag": keep_tag})
 
@@ -260,7 +260,7 @@ def list_release_links(project_id: str, tag_name: str) -> list[ReleaseLink]:
         project_id: Project ID or path
         tag_name: Release tag name
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     release = project.releases.get(tag_name)
     links = release.links.list(get_all=True)
     return ReleaseLink.from_gitlab(links)
@@ -291,7 +291,7 @@ def create_release_link(
         url: URL of the link
         link_type: Type of link (runbook, image, package, other)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     release = project.releases.get(tag_name)
     link = release.releaselinks.create({"name": name, "url": url, "link_type": link_type})
     return ReleaseLink.from_gitlab(link)
@@ -313,7 +313,7 @@ def delete_release_link(project_id: str, tag_name: str, link_id: int) -> Release
         tag_name: Release tag name
         link_id: Release link ID
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     release = project.releases.get(tag_name)
     release.releaselinks.delete(link_id)
     return ReleaseLinkDeleteResult.model_validate({"status": "deleted", "link_id": link_id, "tag_name": tag_name})
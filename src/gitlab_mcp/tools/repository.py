@@ -34,7 +34,7 @@ def get_file_contents(
         file_path: Path to the file in the repository
         ref: Branch, tag, or commit SHA (default: HEAD)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     f = project.files.get(file_path=file_path, ref=ref)
     content = f.decode().decode("utf-8")
 
@@ -62,7 +62,7 @@ def list_directory(
         path: Directory path (empty for root)
         ref: Branch, tag, or commit SHA
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     items: Any = project.repository_tree(path=path, ref=ref)
     return [FileSummary.model_validate(item) for item in items]
 
@@ -160,7 +160,7 @@ def list_commits(
         path: Filter by file path (only commits touching this path)
         include_stats: If True, fetch commit statistics (files changed, insertions, deletions)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     kwargs = {"ref_name": ref, "per_page": limit}
     if path:
         kwargs["path"] = path
@@ -192,7 +192,7 @@ def create_branch(
         branch_name: Name for the new branch
         ref: Source branch, tag, or commit SHA
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     branch = project.branches.create({"branch": branch_name, "ref": ref})
     return BranchSummary.from_gitlab(branch)
 
@@ -218,7 +218,7 @@ def delete_branch(
 
     Note: Cannot delete protected branches without unprotecting first.
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     branch = project.branches.get(branch_name)
 
     if branch.protected:
@@ -281,7 +281,7 @@ def get_repository_tree(
         ref: Branch, tag, or commit SHA
         recursive: Whether to list files recursively
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     items = project.repository_tree(path=path, ref=ref, recursive=recursive)
     return [FileSummary.model_validate(item) for item in items]
 
@@ -312,7 +312,7 @@ def push_files(
             - content: File content
             - action: "create", "update", or "delete"
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
 
     # Convert file dicts to GitLab API actions format
     actions = []
@@ -355,7 +355,7 @@ def get_commit(
         project_id: Project ID or path
         sha: Commit SHA (full or short)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     commit = project.commits.get(sha)
 
     return CommitDetails.model_validate(
@@ -384,14 +384,14 @@ def get_commit_diff(
         project_id: Project ID or path
         sha: Commit SHA (full or short)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     commit = project.commits.get(sha, lazy=True)
     diff = commit.diff()
 
     files_changed = []
     for change in diff:
         files_changed.append(
-            FileChange.model_validate(
+            FileChange.from_gitlab_dict(
                 {
                     "path": change["new_path"] or change["old_path"],
                     "status": change["new_file"]
@@ -425,14 +425,14 @@ def get_branch_diffs(
         from_ref: Source branch/tag/commit
         to_ref: Target branch/tag/commit
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     comparison = project.repository_compare(from_ref, to_ref)
     comparison_dict = cast(dict, comparison)
 
     files_changed = []
     for change in comparison_dict["diffs"]:
         files_changed.append(
-            FileChange.model_validate(
+            FileChange.from_gitlab_dict(
                 {
                     "path": change["new_path"] or change["old_path"],
                     "status": change["new_file"]
@@ -470,12 +470,12 @@ def compare_branches(
         target_branch: Target branch/tag/commit
         straight: Use straight comparison (no merge base)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     comparison = project.repository_compare(source_branch, target_branch, straight=straight)
     comparison_dict = cast(dict, comparison)
 
     commits = [
-        ComparisonCommit.model_validate(
+        ComparisonCommit.from_gitlab_dict(
             {
                 "sha": c["id"][:8],
                 "message": c["title"],
@@ -487,7 +487,7 @@ def compare_branches(
     ]
 
     diffs = [
-        FileChange.model_validate(
+        FileChange.from_gitlab_dict(
             {
                 "path": d["new_path"] or d["old_path"],
                 "status": d["new_file"] and "new" or (d["deleted_file"] and "deleted" or "modified"),
@@ -523,7 +523,7 @@ def get_blame(
         file_path: Path to the file in the repository
         ref: Branch, tag, or commit SHA (default: HEAD)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     blame = project.files.blame(file_path=file_path, ref=ref)
 
     return [
@@ -553,7 +553,7 @@ def get_contributors(
         order_by: Order results by field (name, email, commits)
         sort: Sort order (asc or desc)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     kwargs = {"order_by": order_by, "sort": sort} if order_by else {}
     contributors = project.repository_contributors(**kwargs)
 
@@ -592,7 +592,7 @@ def delete_file(
         commit_message: Commit message for the deletion
         branch: Branch to commit to
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     project.files.delete(file_path=file_path, branch=branch, commit_message=commit_message)
     return FileDeleteResult.model_validate(
         {
@@ -27,7 +27,7 @@ def upload_markdown(project_id: str, file_path: str) -> UploadSummary:
     Returns:
         UploadSummary with markdown link and upload metadata
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
 
     with open(file_path, "rb") as f:
         file_contents = f.read()
@@ -1,6 +1,6 @@
 """Wiki tools."""
 
-from typing import Any, cast
+from typing import Any
 from gitlab_mcp.server import mcp
 from gitlab_mcp.client import get_project
 from gitlab_mcp.models import WikiPageSummary, WikiPageDetail, WikiPageDeleteResult, WikiAttachmentResult
@@ -19,7 +19,7 @@ def list_wiki_pages(
         project_id: Project ID or path (e.g., "mygroup/myproject")
         per_page: Items per page (max 100)
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     pages = paginate(
         project.wikis,
         per_page=per_page,
@@ -35,7 +35,7 @@ def get_wiki_page(project_id: str, slug: str) -> WikiPageDetail:
         project_id: Project ID or path
         slug: Wiki page slug (e.g., "home", "my-page")
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     page = project.wikis.get(slug)
     return WikiPageDetail.from_gitlab(page)
 
@@ -66,7 +66,7 @@ def create_wiki_page(
     Returns:
         Created wiki page
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     data = {
         "title": title,
         "content": content,
@@ -102,7 +102,7 @@ def update_wiki_page(
     Returns:
         Updated wiki page
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     page = project.wikis.get(slug)
     if title:
         page.title = title
@@ -133,7 +133,7 @@ def delete_wiki_page(project_id: str, slug: str) -> WikiPageDeleteResult:
     Returns:
         Confirmation of deletion
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     project.wikis.delete(slug)
     return WikiPageDeleteResult.model_validate({"deleted": True, "slug": slug})
 
@@ -152,7 +152,7 @@ def search_wiki_pages(project_id: str, query: str) -> list[WikiPageSummary]:
     Returns:
         List of matching wiki pages with summaries
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
     query_lower = query.lower()
     results: list[WikiPageSummary] = []
 
@@ -170,7 +170,7 @@ def search_wiki_pages(project_id: str, query: str) -> list[WikiPageSummary]:
                     results.append(WikiPageSummary.from_gitlab(page))
     except Exception:
         # If pagination fails, try direct list
-        for page in project.wikis.list(all=True):
+        for page in project.wikis.list(iterator=True):
             if query_lower in page.title.lower():
                 results.append(WikiPageSummary.from_gitlab(page))
 
@@ -204,7 +204,7 @@ def upload_wiki_attachment(
     Returns:
         Dictionary with markdown link and upload metadata
     """
-    project = get_project(project_id)
+    project = get_project(project_id, lazy=True)
 
     # Validate file exists
     if not os.path.isfile(file_path):
@@ -220,13 +220,15 @@ def upload_wiki_attachment(
     # Use project uploads API
     result: Any = project.uploads.create({"file": (filename, file_contents)})  # type: ignore[reportUnknownVariableType,reportUnknownMemberType]
 
-    return WikiAttachmentResult.model_validate({
-        "markdown": cast(str, result.markdown),
-        "url": cast(str, result.url),
-        "alt": cast(str, result.alt),
-        "filename": filename,
-        "size_bytes": len(file_contents),
-    })
+    return WikiAttachmentResult.model_validate(
+        {
+            "markdown": result.markdown,
+            "url": result.url,
+            "alt": result.alt,
+            "filename": filename,
+            "size_bytes": len(file_contents),
+        }
+    )
 
 
 # Note: Wiki page revision history and revert functionality are not supported via
@@ -2,6 +2,8 @@
 
 from typing import Any
 
+from gitlab_mcp.client import get_json
+
 
 def paginate(
     manager: Any,
@@ -35,3 +37,29 @@ def paginate(
     page = max(page, 1)
 
     return manager.list(page=page, per_page=per_page, **filters)
+
+
+def paginate_json(
+    path: str,
+    per_page: int = 20,
+    page: int = 1,
+    **filters: Any,
+) -> list[dict[str, Any]]:
+    """Fetch one page from a GitLab list endpoint as raw JSON dicts.
+
+    Same clamping as paginate(), but returns the decoded response body
+    instead of RESTObjects. Build models with ``Model.from_gitlab_dict()``.
+
+    Args:
+        path: API path relative to /api/v4 (e.g., "/projects/123/labels")
+        per_page: Number of items to return (default 20, max 100).
+        page: Page number to fetch (default 1, 1-indexed).
+        **filters: Additional query parameters.
+
+    Returns:
+        List of item dicts (up to per_page)
+    """
+    per_page = min(max(per_page, 1), 100)
+    page = max(page, 1)
+
+    return get_json(path, {"page": page, "per_page": per_page, **filters})
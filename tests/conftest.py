@@ -22,6 +22,7 @@ def load(name: str) -> dict | list:
 def reset_singletons(monkeypatch):
     """Reset client and config singletons before each test."""
     monkeypatch.setattr(_client_module, "_client", None)
+    monkeypatch.setattr(_client_module, "_project_misses", {})
     monkeypatch.setattr(_config_module, "_config", None)
 
 
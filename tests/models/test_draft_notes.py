@@ -0,0 +1,28 @@
+"""Tests for draft note models."""
+
+import pytest
+from pydantic import ValidationError
+
+from gitlab_mcp.models.draft_notes import DraftNoteSummary
+
+
+class TestDraftNoteSummary:
+    """Test building draft notes from the draft notes API payload."""
+
+    def test_note_key_becomes_body(self):
+        """Test that the API's "note" key fills the required body field."""
+        draft = DraftNoteSummary.model_validate(
+            {
+                "id": 1,
+                "note": "Please rename this",
+                "in_reply_to_discussion_id": None,
+                "created_at": "2024-01-15T10:30:00Z",
+            }
+        )
+
+        assert draft.model_dump()["body"] == "Please rename this"
+
+    def test_missing_body_is_rejected(self):
+        """Test that a payload without any note text fails validation."""
+        with pytest.raises(ValidationError):
+            DraftNoteSummary.model_validate({"id": 1, "created_at": "2024-01-15T10:30:00Z"})
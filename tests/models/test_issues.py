@@ -0,0 +1,76 @@
+"""Tests for issue models."""
+
+from unittest.mock import MagicMock, patch
+
+from gitlab.base import RESTObject
+
+from gitlab_mcp.models.issues import IssueSummary, IssueTimeStatsSummary
+
+_ISSUE = {
+    "iid": 1,
+    "title": "Bug",
+    "state": "opened",
+    "author": {"username": "alice"},
+    "web_url": "https://gitlab.com/group/project/-/issues/1",
+    "created_at": "2024-01-15T10:30:00Z",
+    "updated_at": "2024-01-15T10:30:00Z",
+}
+
+
+def _rest_object(attrs: dict) -> RESTObject:
+    return RESTObject(MagicMock(_parent_attrs={}), attrs)
+
+
+class TestIssueSummaryTimeStats:
+    """Test the embedded time_stats sub-model."""
+
+    def test_dict_becomes_sub_model(self):
+        """Test that a time_stats dict is validated into IssueTimeStatsSummary."""
+        obj = _rest_object(
+            {
+                **_ISSUE,
+                "time_stats": {
+                    "time_estimate": 3600,
+                    "total_time_spent": 0,
+                    "human_time_estimate": "1h",
+                    "human_total_time_spent": None,
+                    "unrelated": True,
+                },
+            }
+        )
+
+        issue = IssueSummary.from_gitlab(obj)
+
+        assert isinstance(issue.time_stats, IssueTimeStatsSummary)
+        assert issue.model_dump()["time_stats"] == {
+            "time_estimate": 3600,
+            "total_time_spent": 0,
+            "human_time_estimate": "1h",
+            "human_total_time_spent": None,
+        }
+
+    def test_non_dict_is_none(self):
+        """Test that a non-dict value (e.g. the RESTObject method) becomes None."""
+        issue = IssueSummary.from_gitlab(_rest_object({**_ISSUE, "time_stats": lambda: None}))
+
+        assert issue.time_stats is None
+
+
+class TestIssueSummaryList:
+    """Test from_gitlab on a list of RESTObjects for a validated model."""
+
+    def test_list_validated_through_list_adapter(self):
+        """Test that the whole list goes through the cached TypeAdapter once."""
+        objs = [
+            _rest_object({**_ISSUE, "iid": 1, "time_stats": {"time_estimate": 60}}),
+            _rest_object({**_ISSUE, "iid": 2, "author": {"username": "bob"}}),
+        ]
+
+        with patch.object(
+            IssueSummary, "_list_adapter", wraps=IssueSummary._list_adapter
+        ) as adapter:
+            issues = IssueSummary.from_gitlab(objs)
+
+        adapter.assert_called_once_with()
+        assert [(i.iid, i.author.username) for i in issues] == [(1, "alice"), (2, "bob")]
+        assert issues[0].time_stats.time_estimate == 60
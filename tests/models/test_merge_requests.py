@@ -0,0 +1,134 @@
+"""Tests for merge request models."""
+
+from unittest.mock import MagicMock
+
+from gitlab.base import RESTObject
+
+from gitlab_mcp.models.merge_requests import (
+    ApprovalRule,
+    ApprovalStateDetailed,
+    MergeRequestNote,
+    MergeRequestSummary,
+)
+from gitlab_mcp.models.misc import UserRef
+
+_MR = {
+    "iid": 1,
+    "title": "Feature",
+    "state": "opened",
+    "author": {"username": "alice"},
+    "source_branch": "feature",
+    "target_branch": "main",
+    "created_at": "2024-01-15T10:30:00Z",
+    "updated_at": "2024-01-15T10:30:00Z",
+}
+
+
+def _rest_object(attrs: dict) -> RESTObject:
+    return RESTObject(MagicMock(_parent_attrs={}), attrs)
+
+
+class TestMergeRequestSummaryBlockers:
+    """Test the blockers/ready_to_merge computed fields."""
+
+    def test_pipeline_status_blocks_merge(self):
+        """Test that a failed head pipeline is reported and blocks merge."""
+        mr = MergeRequestSummary.from_gitlab(
+            _rest_object({**_MR, "head_pipeline": {"status": "failed"}})
+        )
+
+        dumped = mr.model_dump()
+        assert dumped["head_pipeline_status"] == "failed"
+        assert "head_pipeline" not in dumped
+        assert dumped["blockers"] == ["Pipeline failed"]
+        assert dumped["ready_to_merge"] is False
+
+    def test_blockers_computed_once(self):
+        """Test that blockers is cached on the instance and reused."""
+        mr = MergeRequestSummary.from_gitlab(_rest_object(dict(_MR)))
+
+        assert mr.blockers is mr.blockers
+        assert mr.ready_to_merge is True
+        assert "blockers" not in mr.model_fields_set
+
+
+_NOTE = {
+    "id": 7,
+    "author": {"id": 42, "username": "bob"},
+    "created_at": "2024-01-15T10:30:00Z",
+    "updated_at": "2024-01-15T10:30:00Z",
+    "body": "LGTM",
+    "system": False,
+}
+
+
+class TestMergeRequestNoteAuthor:
+    """Test author flattening for dict and RESTObject payloads."""
+
+    def test_from_dict(self):
+        """Test that a plain dict payload is flattened."""
+        note = MergeRequestNote.model_validate(_NOTE)
+
+        assert (note.author, note.author_id) == ("bob", 42)
+
+    def test_from_rest_object(self):
+        """Test that a RESTObject payload takes the same path as a dict."""
+        obj = _rest_object(dict(_NOTE))
+
+        note = MergeRequestNote.model_validate(obj)
+
+        assert note == MergeRequestNote.model_validate(_NOTE)
+
+
+class TestApprovalStateDetailedFromGitlab:
+    """Test the construction paths for approval state."""
+
+    def test_nested_user_entries_and_rules(self):
+        """Test that {"user": ...} approvers and rules become sub-models."""
+        obj = _rest_object(
+            {
+                "iid": 5,
+                "approved": False,
+                "approvals_required": 2,
+                "approvals_left": 1,
+                "approved_by": [{"user": {"id": 9, "username": "dana", "name": "Dana"}}],
+                "rules": [{"id": 1, "rule_type": "regular", "approvals_required": 2}],
+            }
+        )
+
+        state = ApprovalStateDetailed.from_gitlab(obj)
+
+        assert state.approved_by == [UserRef(id=9, username="dana", name="Dana")]
+        assert isinstance(state.approval_rules_left[0], ApprovalRule)
+        assert state.model_dump()["approval_rules_left"][0]["approvals_required"] == 2
+
+    def test_empty_rule_type_and_missing_username(self):
+        """Test that rules are still normalized and a bare approver doesn't raise."""
+        obj = _rest_object(
+            {
+                "iid": 5,
+                "approved": True,
+                "approved_by": [{"user": {"id": 9}}],
+                "rules": [{"id": 1, "rule_type": "", "approvals_required": 1}],
+            }
+        )
+
+        state = ApprovalStateDetailed.from_gitlab(obj)
+
+        assert state.approved_by[0].username == "unknown"
+        assert state.approval_rules_left[0].rule_type is None
+
+    def test_from_gitlab_dict_validates_rules_alias(self):
+        """Test that raw JSON is validated, mapping "rules" to rule sub-models."""
+        state = ApprovalStateDetailed.from_gitlab_dict(
+            {
+                "iid": 5,
+                "approved": False,
+                "approved_by": [{"id": 9, "username": "dana"}],
+                "rules": [{"id": 1, "rule_type": "", "approvals_required": 1}],
+            }
+        )
+
+        assert state.approved_by == [UserRef(id=9, username="dana")]
+        assert isinstance(state.approval_rules_left[0], ApprovalRule)
+        assert state.approval_rules_left[0].rule_type is None
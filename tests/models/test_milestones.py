@@ -0,0 +1,27 @@
+"""Tests for milestone models."""
+
+from gitlab_mcp.models.milestones import MilestonePromoteResult, MilestoneSummary
+
+
+class TestMilestonePromoteResult:
+    """Test the promote result shares MilestoneSummary's fields."""
+
+    def test_extends_summary(self):
+        """Test that the summary fields come first, followed by promoted."""
+        result = MilestonePromoteResult.model_validate(
+            {
+                "id": 3,
+                "title": "v1.0",
+                "description": "",
+                "state": "active",
+                "web_url": "https://gitlab.com/groups/g/-/milestones/3",
+                "created_at": "2024-01-15T10:30:00Z",
+                "updated_at": "2024-01-15T10:30:00Z",
+                "promoted": True,
+            }
+        )
+
+        dumped = result.model_dump()
+        assert list(dumped) == [*MilestoneSummary.model_fields, "promoted"]
+        assert dumped["description"] is None
+        assert dumped["promoted"] is True
@@ -336,6 +336,20 @@ class TestJobSummary:
         assert job.artifacts is not None
         assert len(job.artifacts) >= 1
 
+    def test_empty_artifact_names_dropped_at_validation(self):
+        """Test empty names are filtered once during validation, not at dump time."""
+        fields = {
+            "id": 556,
+            "name": "build",
+            "stage": "build",
+            "status": "success",
+            "web_url": "https://gitlab.com/project/-/jobs/556",
+            "created_at": "2024-01-15T16:00:00Z",
+        }
+
+        assert JobSummary(**fields, artifacts=["dist.tar.gz", ""]).artifacts == ["dist.tar.gz"]
+        assert JobSummary(**fields, artifacts=[""]).artifacts is None
+
     def test_from_gitlab_missing_optional_attributes(self):
         """Test from_gitlab when job object doesn't have optional attributes."""
         mock_job = Mock(spec=["id", "name", "stage", "status", "web_url", "created_at", "duration"])
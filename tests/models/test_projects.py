@@ -1,6 +1,6 @@
 """Tests for project models."""
 
-
+from datetime import UTC, datetime
 
 from gitlab_mcp.models.projects import ProjectSummary
 
@@ -71,7 +71,7 @@ class TestProjectSummary:
         assert result.id == 456
         assert result.path_with_namespace == "other/repo"
         assert result.name == "Another Project"
-        assert result.description is None  # None is acceptable, serializer converts to "" on output
+        assert result.description == ""  # None is coerced to "" at validation
         assert result.default_branch == "main"  # Default fallback
         assert result.star_count == 0
         assert result.forks_count == 0
@@ -201,3 +201,23 @@ class TestProjectSummary:
         assert isinstance(result.last_activity_at, str)
         # Should be relative time format (not ISO string anymore)
         assert "T" not in result.last_activity_at or result.last_activity_at == "unknown"
+
+    def test_is_active_uses_raw_last_activity(self):
+        """Test that is_active is derived from the ISO timestamp, not the relative text."""
+
+        class MockProject:
+            id = 1
+            path_with_namespace = "test/project"
+            name = "Test"
+            web_url = "https://gitlab.com/test/project"
+            visibility = "public"
+            created_at = "2024-01-15T10:30:00Z"
+            last_activity_at = datetime.now(UTC).isoformat()
+
+        recent = ProjectSummary.model_validate(MockProject(), from_attributes=True)
+        MockProject.last_activity_at = "2020-01-01T00:00:00Z"
+        stale = ProjectSummary.model_validate(MockProject(), from_attributes=True)
+
+        assert recent.is_active is True
+        assert stale.is_active is False
+        assert "last_activity" not in recent.model_dump()
@@ -0,0 +1,98 @@
+"""Tests for repository models."""
+
+from unittest.mock import MagicMock
+
+from gitlab.base import RESTObject
+
+from gitlab_mcp.models.repository import BranchSummary, CommitSummary, FileSummary
+
+_COMMIT = {
+    "id": "6104942438c14ec7bd21c6cd5bd995272b3faff6",
+    "title": "Sanitize for network graph",
+    "author_name": "randx",
+    "created_at": "2024-01-15T10:30:00Z",
+    "parent_ids": ["ae1d9fb46aa2b07ee9836d49862ec4e2c46fbbba"],
+}
+
+
+def _rest_object(attrs: dict) -> RESTObject:
+    return RESTObject(MagicMock(_parent_attrs={}), attrs)
+
+
+class TestCommitSummary:
+    """Test CommitSummary's fields derived from the raw payload."""
+
+    def test_derived_fields(self):
+        """Test short SHAs and stats counts are plain fields set at validation."""
+        commit = CommitSummary.from_gitlab(
+            _rest_object({**_COMMIT, "stats": {"additions": 15, "deletions": 2, "total": 17}})
+        )
+
+        dumped = commit.model_dump()
+        assert dumped.pop("created")
+        assert dumped == {
+            "sha": "61049424",
+            "message": "Sanitize for network graph",
+            "author": "randx",
+            "parent_sha": "ae1d9fb4",
+            "files_changed": 17,
+            "insertions": 15,
+            "deletions": 2,
+        }
+
+    def test_without_parents_or_stats(self):
+        """Test root commits and commits listed without stats."""
+        commit = CommitSummary.from_gitlab(_rest_object({**_COMMIT, "parent_ids": []}))
+
+        assert commit.parent_sha is None
+        assert (commit.files_changed, commit.insertions, commit.deletions) == (None, None, None)
+
+
+class TestBranchSummary:
+    """Test BranchSummary's computed fields."""
+
+    def test_last_activity_formatted_once(self):
+        """Test the relative last_activity is cached on the instance."""
+        branch = BranchSummary.model_validate(
+            {
+                "name": "main",
+                "commit": {"id": "6104942438c14ec7bd21c6cd5bd995272b3faff6"},
+                "last_activity_at": "2024-01-15T10:30:00Z",
+            }
+        )
+
+        assert branch.commit_sha == "61049424"
+        assert branch.last_activity.endswith("ago")
+        assert branch.last_activity is branch.last_activity
+        assert branch.model_dump()["last_activity"] == branch.last_activity
+
+    def test_commit_object_passed_through(self):
+        """Test the full commit object is kept in the output."""
+        commit = {
+            "id": "6104942438c14ec7bd21c6cd5bd995272b3faff6",
+            "title": "Fix",
+            "author_name": "Dana",
+        }
+        branch = BranchSummary.model_validate({"name": "main", "commit": commit})
+
+        assert branch.model_dump()["commit"] == commit
+
+    def test_bare_sha_commit(self):
+        """Test a bare SHA string is normalized to a commit object."""
+        branch = BranchSummary.model_validate({"name": "main", "commit": "ae1d9fb46aa2b07e"})
+
+        assert branch.model_dump()["commit"] == {"id": "ae1d9fb46aa2b07e"}
+        assert branch.commit_sha == "ae1d9fb4"
+
+
+class TestFileSummary:
+    """Test tree entry type normalization."""
+
+    def test_tree_entry_types(self):
+        """Test GitLab's tree/blob types map to directory/file."""
+        types = [
+            FileSummary.model_validate({"path": f"src/{t}", "name": t, "type": t}).type
+            for t in ("tree", "blob", "file")
+        ]
+
+        assert types == ["directory", "file", "file"]
@@ -0,0 +1,18 @@
+"""Tests for upload models."""
+
+from gitlab_mcp.models.uploads import UploadSummary
+
+
+class TestUploadSummary:
+    """Test the filename computed field."""
+
+    def test_filename_from_markdown_link(self):
+        """Test the link target is taken from the last parenthesised part."""
+        upload = UploadSummary(
+            markdown="![shot (1)](/uploads/66dbcd21/shot.png)",
+            url="/uploads/66dbcd21/shot.png",
+            alt="shot (1)",
+        )
+
+        assert upload.filename == "/uploads/66dbcd21/shot.png"
+        assert upload.model_dump()["filename"] == upload.filename
@@ -0,0 +1,32 @@
+"""Tests for wiki models."""
+
+from datetime import UTC, datetime
+
+from gitlab_mcp.models.wiki import WikiPageDetail, WikiPageSummary
+
+
+class TestWikiTimestamps:
+    """Test the shared created/updated timestamp handling."""
+
+    def test_datetime_and_iso_inputs_dump_alike(self):
+        """Test datetime values are rendered like their ISO string equivalents."""
+        for model, extra in ((WikiPageSummary, {}), (WikiPageDetail, {"content": "x"})):
+            page = model.model_validate(
+                {
+                    "slug": "home",
+                    "title": "Home",
+                    "created_at": datetime(2024, 1, 15, 10, 30, tzinfo=UTC),
+                    "updated_at": "2024-01-15T10:30:00+00:00",
+                    **extra,
+                }
+            )
+
+            dumped = page.model_dump()
+            assert dumped["created"] == dumped["updated"]
+            assert dumped["created"].endswith("(2024-01-15T10:30:00+00:00)")
+
+    def test_missing_timestamps_are_none(self):
+        """Test absent timestamps stay None."""
+        page = WikiPageSummary.model_validate({"slug": "home", "title": "Home"})
+
+        assert page.model_dump()["created"] is None
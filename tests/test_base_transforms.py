@@ -1,16 +1,41 @@
 """Pure unit tests for gitlab_mcp.models.base utility functions."""
 
-from datetime import datetime, timedelta, timezone
+from datetime import UTC, datetime, timedelta
+from typing import Annotated
 
 import pytest
+from unittest.mock import MagicMock
+
+from gitlab.base import RESTObject
+from pydantic import Field, TypeAdapter, ValidationError
 
 from gitlab_mcp.models.base import (
+    AuthorUsername,
+    BaseGitLabModel,
+    _relative_time_cached,
+    author_username,
+    EmptyStrToNone,
+    InternedStr,
+    SafeString,
+    ShortSha,
     clean_note_body,
     clean_note_body_raw,
+    empty_str_to_none,
     format_timestamp_with_relative,
+    intern_str,
     relative_time,
     safe_str,
+    utc_now,
 )
+from gitlab_mcp.models.discussions import NoteDeleteResult, NoteDetail, NoteSummary
+from gitlab_mcp.models.draft_notes import DraftNoteSummary
+from gitlab_mcp.models.graphql import PageInfo
+from gitlab_mcp.models.issues import IssueSummary, IssueTimeStats, IssueTimeStatsSummary
+from gitlab_mcp.models.merge_requests import ApprovalRule, MergeRequestNote
+from gitlab_mcp.models.misc import EventSummary, NamespaceVerification, UserSummary
+from gitlab_mcp.models.releases import ReleaseEvidence, ReleaseSummary
+from gitlab_mcp.models.repository import BranchDeleteResult, FileContents
+from gitlab_mcp.models.wiki import WikiPageSummary
 
 
 # ---------------------------------------------------------------------------
@@ -18,7 +43,7 @@ from gitlab_mcp.models.base import (
 # ---------------------------------------------------------------------------
 
 def _now() -> datetime:
-    return datetime.now(timezone.utc)
+    return datetime.now(UTC)
 
 
 def _ago(**kwargs) -> datetime:
@@ -80,6 +105,13 @@ class TestRelativeTime:
         result = relative_time(_ago(days=62))
         assert "2 months ago" in result
 
+    def test_bucket_boundaries_roll_over_to_next_unit(self):
+        assert relative_time(_ago(seconds=60)) == "1 minute ago"
+        assert relative_time(_ago(seconds=3600)) == "1 hour ago"
+        assert relative_time(_ago(seconds=86400)) == "1 day ago"
+        assert relative_time(_ago(seconds=604800)) == "1 week ago"
+        assert relative_time(_ago(seconds=2592000)) == "1 month ago"
+
     def test_iso_string_input(self):
         iso = (_ago(hours=2)).isoformat().replace("+00:00", "Z")
         result = relative_time(iso)
@@ -91,6 +123,26 @@ class TestRelativeTime:
         result = relative_time(naive)
         assert "minute" in result or "just now" in result
 
+    def test_repeated_iso_string_is_served_from_cache(self):
+        iso = (_ago(hours=5)).isoformat()
+        first = relative_time(iso)
+        hits = _relative_time_cached.cache_info().hits
+        assert relative_time(iso) == first
+        assert _relative_time_cached.cache_info().hits == hits + 1
+
+    def test_utc_now_reused_within_a_second(self, monkeypatch):
+        clock = iter([1_700_000_000.1, 1_700_000_000.9, 1_700_000_001.2])
+        monkeypatch.setattr("gitlab_mcp.models.base.time.time", lambda: next(clock))
+        first = utc_now()
+        assert first.tzinfo is UTC
+        assert utc_now() is first
+        assert utc_now() > first
+
+    def test_explicit_now_is_used_as_reference(self):
+        now = datetime(2024, 1, 15, 12, 0, tzinfo=UTC)
+        assert relative_time("2024-01-15T10:00:00Z", now=now) == "2 hours ago"
+        assert relative_time("2024-01-15T13:00:00Z", now=now) == "in the future"
+
 
 # ---------------------------------------------------------------------------
 # format_timestamp_with_relative
@@ -112,6 +164,11 @@ class TestFormatTimestampWithRelative:
         assert "ago" in result or "just now" in result
         assert "(" in result
 
+    def test_explicit_now_passed_through(self):
+        now = datetime(2024, 1, 15, 12, 0, tzinfo=UTC)
+        result = format_timestamp_with_relative("2024-01-14T12:00:00Z", now=now)
+        assert result == "1 day ago (2024-01-14T12:00:00Z)"
+
 
 # ---------------------------------------------------------------------------
 # clean_note_body
@@ -210,3 +267,262 @@ class TestSafeStr:
     def test_whitespace_string_unchanged(self):
         # safe_str uses `or ""` — non-empty whitespace is truthy, preserved
         assert safe_str("  ") == "  "
+
+
+class _SafeStringModel(BaseGitLabModel):
+    text: SafeString = ""
+
+
+class TestSafeStringAlias:
+    def test_none_coerced_at_validation(self):
+        model = _SafeStringModel.model_validate({"text": None})
+        assert model.text == ""
+        assert model.model_dump() == {"text": ""}
+
+    def test_value_preserved(self):
+        assert _SafeStringModel.model_validate({"text": "hi"}).text == "hi"
+
+
+# ---------------------------------------------------------------------------
+# intern_str
+# ---------------------------------------------------------------------------
+
+class _InternedModel(BaseGitLabModel):
+    state: InternedStr
+    kind: InternedStr | None = None
+
+
+class TestInternStr:
+    def test_equal_strings_share_one_object(self):
+        a = "alice!"[:-1]
+        b = "!alice"[1:]
+        assert a is not b
+        assert intern_str(a) is intern_str(b)
+
+    def test_non_strings_pass_through(self):
+        assert intern_str(None) is None
+        assert intern_str(5) == 5
+
+    def test_optional_interned_field(self):
+        a = _InternedModel.model_validate({"state": "x", "kind": "Issue!"[:-1]})
+        b = _InternedModel.model_validate({"state": "x", "kind": "!Issue"[1:]})
+        assert a.kind is b.kind
+        assert _InternedModel.model_validate({"state": "x"}).kind is None
+
+    def test_interned_field_shares_one_object(self):
+        a = _InternedModel.model_validate({"state": "active!"[:-1]})
+        b = _InternedModel.model_validate({"state": "!active"[1:]})
+        assert a.state is b.state
+
+
+# ---------------------------------------------------------------------------
+# short_sha / ShortSha
+# ---------------------------------------------------------------------------
+
+class _ShortShaModel(BaseGitLabModel):
+    sha: ShortSha
+
+
+class TestShortSha:
+    def test_full_sha_shortened(self):
+        sha = "6104942438c14ec7bd21c6cd5bd995272b3faff6"
+        assert _ShortShaModel.model_validate({"sha": sha}).sha == "61049424"
+
+    def test_short_sha_unchanged(self):
+        assert _ShortShaModel.model_validate({"sha": "abc"}).sha == "abc"
+
+
+# ---------------------------------------------------------------------------
+# author_username / AuthorUsername
+# ---------------------------------------------------------------------------
+
+class _AuthorModel(BaseGitLabModel):
+    author: AuthorUsername
+
+
+class TestAuthorUsername:
+    def test_dict_flattened_to_username(self):
+        assert author_username({"id": 1, "username": "alice"}) == "alice"
+
+    def test_missing_username_is_unknown(self):
+        assert author_username({"id": 1}) == "unknown"
+
+    def test_string_passes_through(self):
+        assert author_username("bob") == "bob"
+
+    def test_alias_applies_on_attribute_validation(self):
+        obj = _rest_object({"author": {"username": "carol"}})
+        assert _AuthorModel.from_gitlab(obj).author == "carol"
+
+
+# ---------------------------------------------------------------------------
+# empty_str_to_none / EmptyStrToNone
+# ---------------------------------------------------------------------------
+
+class _EmptyStrModel(BaseGitLabModel):
+    description: EmptyStrToNone = None
+    title: str = ""
+
+
+class TestEmptyStrToNone:
+    def test_empty_string_becomes_none(self):
+        assert empty_str_to_none("") is None
+
+    def test_other_values_unchanged(self):
+        assert empty_str_to_none("text") == "text"
+        assert empty_str_to_none(None) is None
+        assert empty_str_to_none(0) == 0
+
+    def test_annotated_field_converts_empty_string(self):
+        assert _EmptyStrModel.model_validate({"description": ""}).description is None
+
+    def test_plain_str_field_keeps_empty_string(self):
+        assert _EmptyStrModel.model_validate({"title": ""}).title == ""
+
+
+# Optional text fields that normalized "" to None under the old wildcard
+# validator and must keep doing so
+_EMPTY_STR_TO_NONE_FIELDS = [
+    (NoteSummary, "body"),
+    (NoteSummary, "updated_at"),
+    (NoteDetail, "body"),
+    (NoteDeleteResult, "discussion_id"),
+    (DraftNoteSummary, "in_reply_to_discussion_id"),
+    (PageInfo, "start_cursor"),
+    (PageInfo, "end_cursor"),
+    (IssueTimeStats, "human_time_estimate"),
+    (IssueTimeStats, "human_total_time_spent"),
+    (IssueTimeStatsSummary, "human_time_estimate"),
+    (IssueTimeStatsSummary, "human_total_time_spent"),
+    (MergeRequestNote, "body"),
+    (ApprovalRule, "rule_type"),
+    (UserSummary, "last_active"),
+    (EventSummary, "action"),
+    (EventSummary, "target_type"),
+    (NamespaceVerification, "name"),
+    (NamespaceVerification, "path"),
+    (NamespaceVerification, "full_path"),
+    (NamespaceVerification, "error"),
+    (ReleaseSummary, "released_at"),
+    (ReleaseEvidence, "evidence_url"),
+    (FileContents, "syntax_language"),
+    (BranchDeleteResult, "error"),
+    (WikiPageSummary, "created"),
+    (WikiPageSummary, "updated"),
+]
+
+
+class TestOptionalStringFieldsNormalizeEmpty:
+    @pytest.mark.parametrize(
+        ("model", "field"),
+        _EMPTY_STR_TO_NONE_FIELDS,
+        ids=[f"{m.__name__}.{f}" for m, f in _EMPTY_STR_TO_NONE_FIELDS],
+    )
+    def test_empty_string_becomes_none(self, model, field):
+        info = model.model_fields[field]
+        adapter = TypeAdapter(Annotated[info.annotation, *info.metadata])
+        assert adapter.validate_python("") is None
+
+    def test_issue_milestone_empty_string_becomes_none(self):
+        assert IssueSummary.extract_milestone("") is None
+
+
+# ---------------------------------------------------------------------------
+# from_gitlab trusted fast path
+# ---------------------------------------------------------------------------
+
+class _TrustedModel(BaseGitLabModel):
+    __gitlab_trusted__ = True
+
+    id: int
+    name: str
+    url: str = Field(alias="web_url")
+    color: str = "#FFFFFF"
+
+
+class _UntrustedModel(BaseGitLabModel):
+    id: int
+    name: str
+
+
+def _rest_object(attrs: dict) -> RESTObject:
+    return RESTObject(MagicMock(_parent_attrs={}), attrs)
+
+
+class TestFromGitlabTrusted:
+    def test_trusted_model_skips_validation(self):
+        obj = _rest_object({"id": "not-an-int", "name": "x", "web_url": "u", "extra": 1})
+        result = _TrustedModel.from_gitlab(obj)
+        assert result.id == "not-an-int"
+        assert result.url == "u"
+        assert result.color == "#FFFFFF"
+        assert not hasattr(result, "extra")
+
+    def test_trusted_model_list(self):
+        objs = [_rest_object({"id": i, "name": f"n{i}", "web_url": "u"}) for i in range(3)]
+        result = _TrustedModel.from_gitlab(objs)
+        assert [r.id for r in result] == [0, 1, 2]
+
+    def test_trusted_model_sees_updated_attrs(self):
+        obj = _rest_object({"id": 1, "name": "old", "web_url": "u"})
+        obj.name = "new"
+        assert _TrustedModel.from_gitlab(obj).name == "new"
+
+    def test_untrusted_model_still_validates(self):
+        obj = _rest_object({"id": "not-an-int", "name": "x"})
+        with pytest.raises(ValidationError):
+            _UntrustedModel.from_gitlab(obj)
+
+
+# ---------------------------------------------------------------------------
+# from_gitlab list handling
+# ---------------------------------------------------------------------------
+
+class TestFromGitlabList:
+    def test_list_validated_in_one_pass(self):
+        objs = [_rest_object({"id": str(i), "name": f"n{i}"}) for i in range(3)]
+        result = _UntrustedModel.from_gitlab(objs)
+        assert [r.id for r in result] == [0, 1, 2]
+        assert all(isinstance(r, _UntrustedModel) for r in result)
+
+    def test_list_adapter_is_cached_per_class(self):
+        assert _UntrustedModel._list_adapter() is _UntrustedModel._list_adapter()
+        assert _UntrustedModel._list_adapter() is not _TrustedModel._list_adapter()
+
+    def test_list_of_dicts_rejected(self):
+        with pytest.raises(TypeError):
+            _UntrustedModel.from_gitlab([{"id": 1, "name": "x"}])
+
+    def test_invalid_item_raises(self):
+        objs = [_rest_object({"id": 1, "name": "ok"}), _rest_object({"id": "bad", "name": "x"})]
+        with pytest.raises(ValidationError):
+            _UntrustedModel.from_gitlab(objs)
+
+
+# ---------------------------------------------------------------------------
+# from_gitlab_dict
+# ---------------------------------------------------------------------------
+
+class TestFromGitlabDict:
+    def test_single_dict_is_validated(self):
+        result = _UntrustedModel.from_gitlab_dict({"id": "7", "name": "x"})
+        assert result.id == 7
+
+    def test_list_of_dicts(self):
+        result = _TrustedModel.from_gitlab_dict(
+            [{"id": i, "name": f"n{i}", "web_url": "u"} for i in range(3)]
+        )
+        assert [r.url for r in result] == ["u", "u", "u"]
+
+    def test_invalid_dict_raises(self):
+        with pytest.raises(ValidationError):
+            _UntrustedModel.from_gitlab_dict({"id": "not-an-int", "name": "x"})
+
+    def test_trusted_model_skips_validation(self):
+        result = _TrustedModel.from_gitlab_dict({"id": "not-an-int", "name": "x", "web_url": "u"})
+        assert result.id == "not-an-int"
+        assert result.url == "u"
+
+    def test_trusted_model_list(self):
+        result = _TrustedModel.from_gitlab_dict([{"id": 1, "name": "a", "web_url": "u"}])
+        assert result[0].color == "#FFFFFF"
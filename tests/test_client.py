@@ -1,9 +1,17 @@
 """Tests for GitLab client configuration."""
 
+import threading
+import gitlab
 import pytest
 import requests
 from unittest.mock import patch
-from gitlab_mcp.client import get_client, _create_session_with_retries
+from gitlab_mcp.client import (
+    clear_project_cache,
+    get_client,
+    get_json,
+    get_project,
+    _create_session_with_retries,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -74,6 +82,38 @@ class TestSessionCreation:
         # HTTPAdapter should have pool configuration
         assert hasattr(adapter, "_pool_connections")
         assert hasattr(adapter, "_pool_maxsize")
+        assert adapter._pool_connections == 32
+        assert adapter._pool_maxsize == 64
+        assert adapter._pool_block is False
+
+    def test_retry_strategy_reused_across_sessions(self):
+        """Test that sessions with the same retry settings share one Retry."""
+        adapter1 = _create_session_with_retries(retry_count=4).get_adapter("https://")
+        adapter2 = _create_session_with_retries(retry_count=4).get_adapter("https://")
+        assert adapter1.max_retries is adapter2.max_retries
+        assert adapter1 is not adapter2
+
+    def test_custom_pool_sizes(self):
+        """Test session with custom pool sizes."""
+        session = _create_session_with_retries(pool_connections=4, pool_maxsize=8)
+        adapter = session.get_adapter("https://")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 8
+
+    def test_tcp_keepalive_enabled(self):
+        """Test that pooled connections enable TCP keepalive."""
+        import socket
+
+        session = _create_session_with_retries()
+        adapter = session.get_adapter("https://")
+        socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+    def test_retry_respects_retry_after(self):
+        """Test that retries honour the Retry-After header on 429/503."""
+        session = _create_session_with_retries()
+        adapter = session.get_adapter("https://")
+        assert adapter.max_retries.respect_retry_after_header is True
 
 
 class TestClientAuthentication:
@@ -192,6 +232,19 @@ class TestClientConfiguration:
         assert adapter.max_retries.total == 5
         assert adapter.max_retries.backoff_factor == 1.0
 
+    @patch("gitlab_mcp.client.gitlab.Gitlab")
+    def test_session_pool_sizes_from_env(self, mock_gitlab, monkeypatch):
+        """Test that pool sizes are read from the environment."""
+        monkeypatch.setenv("GITLAB_POOL_CONNECTIONS", "5")
+        monkeypatch.setenv("GITLAB_POOL_MAXSIZE", "50")
+
+        get_client()
+
+        session = mock_gitlab.call_args[1]["session"]
+        adapter = session.get_adapter("https://")
+        assert adapter._pool_connections == 5
+        assert adapter._pool_maxsize == 50
+
     @patch("gitlab_mcp.client.gitlab.Gitlab")
     def test_url_configuration(self, mock_gitlab, monkeypatch):
         """Test client created with correct GitLab URL."""
@@ -220,6 +273,157 @@ class TestClientSingleton:
         assert mock_gitlab.call_count == 1
         assert client1 is client2
 
+    @patch("gitlab_mcp.client.gitlab.Gitlab")
+    def test_client_singleton_concurrent(self, mock_gitlab, monkeypatch):
+        """Test that concurrent first calls build a single client."""
+        monkeypatch.setenv("GITLAB_PERSONAL_ACCESS_TOKEN", "test-token")
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(get_client())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert mock_gitlab.call_count == 1
+        assert all(c is results[0] for c in results)
+
+
+class TestGetProject:
+    """Test project lookup with default project fallback."""
+
+    @patch("gitlab_mcp.client.gitlab.Gitlab")
+    def test_default_project_id(self, mock_gitlab, monkeypatch):
+        """Test that the configured default project is used when none is given."""
+        monkeypatch.setenv("GITLAB_PROJECT_ID", "123")
+
+        get_project()
+
+        mock_gitlab.return_value.projects.get.assert_called_once_with("123")
+
+    @patch("gitlab_mcp.client.gitlab.Gitlab")
+    def test_explicit_project_id_wins(self, mock_gitlab, monkeypatch):
+        """Test that an explicit project_id overrides the default."""
+        monkeypatch.setenv("GITLAB_PROJECT_ID", "123")
+
+        get_project("group/project")
+
+        mock_gitlab.return_value.projects.get.assert_called_once_with("group/project")
+
+    @patch("gitlab_mcp.client.gitlab.Gitlab")
+    def test_no_project_id_raises(self, mock_gitlab, monkeypatch):
+        """Test that a missing project_id without a default raises ValueError."""
+        monkeypatch.delenv("GITLAB_PROJECT_ID", raising=False)
+
+        with pytest.raises(ValueError, match="project_id is required"):
+            get_project()
+
+    @patch("gitlab_mcp.client.gitlab.Gitlab")
+    def test_repeat_lookup_fetches_fresh(self, mock_gitlab):
+        """Test that found projects aren't cached, so attributes are never stale."""
+        get_project("group/project")
+        get_project("group/project")
+
+        assert mock_gitlab.return_value.projects.get.call_count == 2
+
+    @patch("gitlab_mcp.client.gitlab.Gitlab")
+    def test_lazy_handle(self, mock_gitlab):
+        """Test that lazy=True asks python-gitlab for a handle without a request."""
+        get_project("group/project", lazy=True)
+
+        mock_gitlab.return_value.projects.get.assert_called_once_with("group/project", lazy=True)
+
+    @patch("gitlab_mcp.client.gitlab.Gitlab")
+    def test_not_found_is_cached(self, mock_gitlab):
+        """Test that a 404 is remembered and re-raised without another call."""
+        mock_gitlab.return_value.projects.get.side_effect = gitlab.exceptions.GitlabGetError(
+            "404 Project Not Found", response_code=404
+        )
+
+        errors = []
+        for _ in range(2):
+            with pytest.raises(gitlab.exceptions.GitlabGetError) as excinfo:
+                get_project("missing/project")
+            errors.append(excinfo.value)
+
+        mock_gitlab.return_value.projects.get.assert_called_once()
+        assert errors[0] is not errors[1]
+        assert errors[1].response_code == 404
+
+    @patch("gitlab_mcp.client.gitlab.Gitlab")
+    def test_cached_miss_applies_to_lazy_handles(self, mock_gitlab):
+        """Test that a remembered 404 is raised before building a lazy handle."""
+        mock_gitlab.return_value.projects.get.side_effect = gitlab.exceptions.GitlabGetError(
+            "404 Project Not Found", response_code=404
+        )
+        with pytest.raises(gitlab.exceptions.GitlabGetError):
+            get_project("missing/project")
+
+        with pytest.raises(gitlab.exceptions.GitlabGetError):
+            get_project("missing/project", lazy=True)
+
+        mock_gitlab.return_value.projects.get.assert_called_once()
+
+    @patch("gitlab_mcp.client.gitlab.Gitlab")
+    def test_expired_or_cleared_miss_is_refetched(self, mock_gitlab, monkeypatch):
+        """Test that misses past the TTL, or after clearing, go back to the API."""
+        mock_gitlab.return_value.projects.get.side_effect = gitlab.exceptions.GitlabGetError(
+            "404 Project Not Found", response_code=404
+        )
+        monkeypatch.setattr("gitlab_mcp.client._PROJECT_MISS_TTL", -1)
+        for _ in range(2):
+            with pytest.raises(gitlab.exceptions.GitlabGetError):
+                get_project("missing/project")
+        monkeypatch.setattr("gitlab_mcp.client._PROJECT_MISS_TTL", 30)
+        for _ in range(2):
+            with pytest.raises(gitlab.exceptions.GitlabGetError):
+                get_project("missing/project")
+            clear_project_cache()
+
+        assert mock_gitlab.return_value.projects.get.call_count == 4
+
+    @patch("gitlab_mcp.client.gitlab.Gitlab")
+    def test_server_error_is_not_cached(self, mock_gitlab):
+        """Test that non-404 failures are retried on the next call."""
+        mock_gitlab.return_value.projects.get.side_effect = gitlab.exceptions.GitlabGetError(
+            "500 Internal Server Error", response_code=500
+        )
+
+        for _ in range(2):
+            with pytest.raises(gitlab.exceptions.GitlabGetError):
+                get_project("group/project")
+
+        assert mock_gitlab.return_value.projects.get.call_count == 2
+
+
+class TestGetJson:
+    """Test raw JSON fetching."""
+
+    @patch("gitlab_mcp.client.gitlab.Gitlab")
+    def test_decodes_raw_response(self, mock_gitlab, monkeypatch):
+        """Test the body is decoded directly rather than via RESTObjects."""
+        monkeypatch.setenv("GITLAB_PERSONAL_ACCESS_TOKEN", "test-token")
+        mock_gitlab.return_value.http_get.return_value.content = b'[{"id": 1}]'
+
+        assert get_json("/projects/1/labels", {"page": 1}) == [{"id": 1}]
+        mock_gitlab.return_value.http_get.assert_called_once_with(
+            "/projects/1/labels", query_data={"page": 1}, raw=True
+        )
+
+    @patch("gitlab_mcp.client.gitlab.Gitlab")
+    def test_invalid_json_raises_parsing_error(self, mock_gitlab, monkeypatch):
+        """Test that undecodable bodies surface as GitlabParsingError."""
+        monkeypatch.setenv("GITLAB_PERSONAL_ACCESS_TOKEN", "test-token")
+        mock_gitlab.return_value.http_get.return_value.content = b"<html>"
+
+        with pytest.raises(gitlab.exceptions.GitlabParsingError):
+            get_json("/projects/1/labels")
+
 
 class TestBackwardsCompatibility:
     """Test backwards compatibility with existing token configuration."""
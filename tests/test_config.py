@@ -1,7 +1,9 @@
 """Tests for configuration loading."""
 
+import dataclasses
 import os
-from gitlab_mcp.config import Config
+import pytest
+from gitlab_mcp.config import Config, get_config
 
 
 class TestConfig:
@@ -24,6 +26,8 @@ class TestConfig:
         assert config.retry_count == 3
         assert config.retry_backoff == 0.5
         assert config.timeout == 30
+        assert config.pool_connections == 32
+        assert config.pool_maxsize == 64
 
     def test_custom_url(self, monkeypatch):
         """Test custom GitLab URL."""
@@ -132,3 +136,14 @@ class TestConfig:
         assert config.retry_count == 10
         assert config.retry_backoff == 2.0
         assert config.timeout == 120
+
+    def test_config_is_frozen(self):
+        """Test that config cannot be mutated after loading."""
+        config = Config.from_env()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.read_only = True  # type: ignore[misc]
+
+    def test_get_config_singleton(self, monkeypatch):
+        """Test that get_config loads the environment only once."""
+        monkeypatch.setattr("gitlab_mcp.config._config", None)
+        assert get_config() is get_config()
@@ -2,9 +2,18 @@
 
 import pytest
 from datetime import datetime, timezone, timedelta
+from types import SimpleNamespace
+
+from gitlab.base import RESTObject
+from pydantic import ValidationError
 
 from gitlab_mcp.tools.discussions import _parse_newer_than, _truncate_note, _filter_discussions
-from gitlab_mcp.models.discussions import NoteSummary, DiscussionSummary
+from gitlab_mcp.models.discussions import (
+    NoteDetail,
+    NoteSummary,
+    DiscussionSummary,
+    DiscussionDetail,
+)
 from gitlab_mcp.models.merge_requests import MergeRequestDiff
 
 
@@ -300,6 +309,70 @@ class TestNoteSummaryFlattenAuthor:
         assert note.author == "unknown"
 
 
+# ---------------------------------------------------------------------------
+# DiscussionSummary.from_gitlab / DiscussionDetail.from_gitlab
+# ---------------------------------------------------------------------------
+
+
+def _discussion_obj(discussion_id: str, note_ids: list[int]) -> RESTObject:
+    notes = [
+        {
+            "id": i,
+            "body": "hi",
+            "author": {"username": "alice"},
+            "created_at": "2026-03-18T10:00:00Z",
+        }
+        for i in note_ids
+    ]
+    manager = SimpleNamespace(_parent_attrs={}, parent_attrs={})
+    return RESTObject(manager, {"id": discussion_id, "individual_note": False, "notes": notes})
+
+
+class TestDiscussionFromGitlab:
+    def test_list_builds_notes_and_counts(self):
+        objs = [_discussion_obj("a", [1, 2, 3]), _discussion_obj("b", [4])]
+        result = DiscussionSummary.from_gitlab(objs)
+        assert [d.note_count for d in result] == [3, 1]
+        assert result[0].notes[0].author == "alice"
+
+    def test_detail_single_object(self):
+        result = DiscussionDetail.from_gitlab(_discussion_obj("a", [1, 2]))
+        assert result.id == "a"
+        assert [n.id for n in result.notes] == [1, 2]
+
+    def test_missing_notes_is_empty(self):
+        obj = RESTObject(SimpleNamespace(_parent_attrs={}, parent_attrs={}), {"id": "x"})
+        result = DiscussionSummary.from_gitlab(obj)
+        assert result.notes == [] and result.note_count == 0
+
+    def test_detail_notes_dump_like_validated_notes(self):
+        result = DiscussionDetail.from_gitlab(_discussion_obj("a", [1]))
+        note = result.model_dump()["notes"][0]
+        assert note["author"] == "alice"
+        assert note["body"] == "hi"
+
+    def test_plain_dict_is_rejected(self):
+        with pytest.raises(TypeError, match="from_gitlab_dict"):
+            DiscussionSummary.from_gitlab({"id": "a", "notes": []})
+
+    def test_from_gitlab_dict_builds_nested_notes(self):
+        raw = _discussion_obj("a", [1, 2]).asdict()
+        [summary] = DiscussionSummary.from_gitlab_dict([raw])
+        detail = DiscussionDetail.from_gitlab_dict(raw)
+        assert summary.note_count == 2
+        assert isinstance(summary.notes[0], NoteSummary)
+        assert isinstance(detail.notes[0], NoteDetail)
+        assert detail.notes[1].author == "alice"
+
+    def test_note_missing_required_key_is_rejected(self):
+        manager = SimpleNamespace(_parent_attrs={}, parent_attrs={})
+        obj = RESTObject(
+            manager, {"id": "a", "notes": [{"id": 1, "author": {"username": "alice"}}]}
+        )
+        with pytest.raises(ValidationError):
+            DiscussionSummary.from_gitlab(obj)
+
+
 # ---------------------------------------------------------------------------
 # MergeRequestDiff.status computed field
 # ---------------------------------------------------------------------------
@@ -4,7 +4,13 @@ import json
 import pook
 from pathlib import Path
 
-from gitlab_mcp.tools.discussions import list_issue_discussions, get_mr_discussion, mr_discussions
+from gitlab_mcp.tools.discussions import (
+    list_issue_discussions,
+    get_mr_discussion,
+    mr_discussions,
+    resolve_merge_request_thread,
+    create_note,
+)
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 PROJECT_ID = "278964"
@@ -25,11 +31,6 @@ def _mock_project():
 def test_list_issue_discussions():
     """Smoke test: list_issue_discussions returns a list of DiscussionSummary objects."""
     _mock_project()
-    pook.get(
-        f"{BASE_URL}/projects/{PROJECT_ID}/issues/{ISSUE_IID}",
-        reply=200,
-        response_json=load("issue_single.json"),
-    )
     pook.get(
         f"{BASE_URL}/projects/{PROJECT_ID}/issues/{ISSUE_IID}/discussions",
         reply=200,
@@ -43,11 +44,6 @@ def test_list_issue_discussions():
 def test_get_mr_discussion():
     """Smoke test: get_mr_discussion returns a DiscussionDetail with the correct id."""
     _mock_project()
-    pook.get(
-        f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests/{MR_IID}",
-        reply=200,
-        response_json=load("mr_single.json"),
-    )
     pook.get(
         f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests/{MR_IID}/discussions/{MR_DISCUSSION_ID}",
         reply=200,
@@ -62,11 +58,6 @@ def test_get_mr_discussion():
 def test_mr_discussions():
     """Smoke test: mr_discussions returns a list of DiscussionSummary objects."""
     _mock_project()
-    pook.get(
-        f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests/{MR_IID}",
-        reply=200,
-        response_json=load("mr_single.json"),
-    )
     pook.get(
         f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests/{MR_IID}/discussions",
         reply=200,
@@ -75,3 +66,29 @@ def test_mr_discussions():
     result = mr_discussions(PROJECT_ID, MR_IID)
     assert isinstance(result, list)
     assert len(result) > 0
+
+
+def test_resolve_merge_request_thread():
+    """resolve_merge_request_thread builds the result from the PUT response alone."""
+    _mock_project()
+    pook.put(
+        f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests/{MR_IID}/discussions/{MR_DISCUSSION_ID}",
+        reply=200,
+        response_json=load("mr_discussion_single.json"),
+    )
+    result = resolve_merge_request_thread(PROJECT_ID, MR_IID, MR_DISCUSSION_ID)
+    assert result.id == MR_DISCUSSION_ID
+    assert result.note_count == len(result.notes)
+
+
+def test_create_note_starts_a_thread():
+    """create_note posts a new MR discussion, same as create_merge_request_thread."""
+    _mock_project()
+    pook.post(
+        f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests/{MR_IID}/discussions",
+        reply=201,
+        json={"body": "Looks good"},
+        response_json=load("mr_discussion_single.json"),
+    )
+    result = create_note(PROJECT_ID, MR_IID, "Looks good")
+    assert result.id == MR_DISCUSSION_ID
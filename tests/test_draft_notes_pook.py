@@ -4,7 +4,7 @@ import json
 import pook
 from pathlib import Path
 
-from gitlab_mcp.tools.draft_notes import list_draft_notes, get_draft_note
+from gitlab_mcp.tools.draft_notes import list_draft_notes, get_draft_note, bulk_publish_draft_notes
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 PROJECT_ID = "278964"
@@ -19,11 +19,6 @@ def load(name: str) -> dict | list:
 
 def test_list_draft_notes(mock_project):
     """Smoke test: list_draft_notes returns a list of DraftNoteSummary objects."""
-    pook.get(
-        f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests/{MR_IID}",
-        reply=200,
-        response_json=load("mr_single.json"),
-    )
     pook.get(
         f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests/{MR_IID}/draft_notes",
         reply=200,
@@ -39,11 +34,6 @@ def test_list_draft_notes(mock_project):
 
 def test_get_draft_note(mock_project):
     """Smoke test: get_draft_note returns a single DraftNoteSummary."""
-    pook.get(
-        f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests/{MR_IID}",
-        reply=200,
-        response_json=load("mr_single.json"),
-    )
     pook.get(
         f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests/{MR_IID}/draft_notes/{DRAFT_NOTE_ID}",
         reply=200,
@@ -52,3 +42,58 @@ def test_get_draft_note(mock_project):
     result = get_draft_note(PROJECT_ID, MR_IID, DRAFT_NOTE_ID)
     assert result.id == DRAFT_NOTE_ID
     assert hasattr(result, "body")
+
+
+def test_bulk_publish_draft_notes(mock_project):
+    """bulk_publish_draft_notes uses the bulk_publish endpoint."""
+    pook.post(
+        f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests/{MR_IID}/draft_notes/bulk_publish",
+        reply=204,
+    )
+    result = bulk_publish_draft_notes(PROJECT_ID, MR_IID)
+    assert result.published_all is True
+    assert result.merge_request_iid == MR_IID
+
+
+def test_bulk_publish_draft_notes_falls_back_per_note(mock_project):
+    """Without the bulk endpoint, every draft note is published individually."""
+    drafts_url = f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests/{MR_IID}/draft_notes"
+    pook.post(f"{drafts_url}/bulk_publish", reply=404, response_json={"message": "404 Not Found"})
+    pook.get(
+        drafts_url,
+        reply=200,
+        response_json=[{"id": 1, "note": "a"}, {"id": 2, "note": "b"}],
+    )
+    publish_1 = pook.put(f"{drafts_url}/1/publish", reply=204)
+    publish_2 = pook.put(f"{drafts_url}/2/publish", reply=204)
+
+    result = bulk_publish_draft_notes(PROJECT_ID, MR_IID)
+
+    assert result.published_all is True
+    assert publish_1.calls == 1
+    assert publish_2.calls == 1
+
+
+def test_bulk_publish_fallback_reads_every_page_before_publishing(mock_project):
+    """Drafts on later pages are listed up front and published in list order."""
+    drafts_url = f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests/{MR_IID}/draft_notes"
+    calls = []
+    pook.post(f"{drafts_url}/bulk_publish", reply=404, response_json={"message": "404 Not Found"})
+    pook.get(
+        drafts_url,
+        reply=200,
+        response_json=[{"id": 1, "note": "a"}, {"id": 2, "note": "b"}],
+        response_headers={"Link": f'<{drafts_url}?page=2&per_page=2>; rel="next"'},
+    ).callback(lambda req, mock: calls.append("page 1"))
+    pook.get(drafts_url, reply=200, response_json=[{"id": 3, "note": "c"}]).param(
+        "page", "2"
+    ).callback(lambda req, mock: calls.append("page 2"))
+    for note_id in (1, 2, 3):
+        pook.put(f"{drafts_url}/{note_id}/publish", reply=204).callback(
+            lambda req, mock, note_id=note_id: calls.append(f"publish {note_id}")
+        )
+
+    result = bulk_publish_draft_notes(PROJECT_ID, MR_IID)
+
+    assert result.published_all is True
+    assert calls == ["page 1", "page 2", "publish 1", "publish 2", "publish 3"]
@@ -80,6 +80,7 @@ def test_list_issue_links():
     assert isinstance(result, list)
     assert len(result) > 0
     assert hasattr(result[0], "id")
+    assert result[0].type == load("issue_links.json")[0]["link_type"]
 
 
 def test_get_issue_link():
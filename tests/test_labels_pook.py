@@ -2,6 +2,7 @@
 
 import json
 import pook
+import pytest
 from pathlib import Path
 
 from gitlab_mcp.tools.labels import list_labels, get_label
@@ -33,6 +34,32 @@ def test_list_labels(mock_project):
     assert hasattr(result[0], "color")
 
 
+def test_list_labels_encodes_project_path(gitlab_token):
+    pook.get(
+        f"{BASE_URL}/projects/mygroup%2Fmyproject/labels",
+        reply=200,
+        response_json=load("labels_list.json"),
+    )
+    result = list_labels("mygroup/myproject")
+    assert len(result) > 0
+
+
+def test_list_labels_uses_default_project(gitlab_token, monkeypatch):
+    monkeypatch.setenv("GITLAB_PROJECT_ID", PROJECT_ID)
+    pook.get(
+        f"{BASE_URL}/projects/{PROJECT_ID}/labels",
+        reply=200,
+        response_json=load("labels_list.json"),
+    )
+    result = list_labels("")
+    assert len(result) > 0
+
+
+def test_list_labels_without_project_id_raises(gitlab_token):
+    with pytest.raises(ValueError, match="project_id is required"):
+        list_labels("")
+
+
 def test_get_label(mock_project):
     pook.get(
         f"{BASE_URL}/projects/{PROJECT_ID}/labels/{LABEL_ID}",
@@ -39,15 +39,6 @@ def _mock_milestone():
     )
 
 
-def _mock_mr_approvals(iid: int):
-    """Mock the approvals endpoint called by MergeRequestSummary.from_gitlab."""
-    pook.get(
-        f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests/{iid}/approvals",
-        reply=200,
-        response_json={"approvals_required": 0, "approvals_left": 0, "approved_by": []},
-    )
-
-
 def test_list_milestones():
     """Smoke test: list_milestones returns a list of MilestoneSummary objects."""
     _mock_project()
@@ -62,6 +53,18 @@ def test_list_milestones():
     assert isinstance(results[0], MilestoneSummary)
 
 
+def test_list_milestones_uses_default_project(monkeypatch):
+    """list_milestones falls back to the configured default project."""
+    monkeypatch.setenv("GITLAB_PROJECT_ID", PROJECT_ID)
+    pook.get(
+        f"{BASE_URL}/projects/{PROJECT_ID}/milestones",
+        reply=200,
+        response_json=load("milestones_list.json"),
+    )
+    results = list_milestones("")
+    assert len(results) > 0
+
+
 def test_get_milestone():
     """Smoke test: get_milestone returns a MilestoneSummary with correct id and title."""
     _mock_project()
@@ -95,9 +98,6 @@ def test_get_milestone_merge_requests():
         reply=200,
         response_json=load("milestone_merge_requests.json"),
     )
-    # MergeRequestSummary.from_gitlab fetches approvals for each MR
-    for iid in [mr["iid"] for mr in load("milestone_merge_requests.json")]:
-        _mock_mr_approvals(iid)
     results = get_milestone_merge_requests(PROJECT_ID, MILESTONE_ID)
     assert isinstance(results, list)
     assert len(results) > 0
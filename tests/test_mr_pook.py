@@ -14,6 +14,7 @@ def load(name: str) -> dict | list:
 
 
 from gitlab_mcp.tools.merge_requests import (
+    create_merge_request,
     get_merge_request,
     list_merge_requests,
     get_merge_request_diff,
@@ -32,12 +33,12 @@ def _mock_project():
     pook.get(f"{BASE_URL}/projects/{PROJECT_ID}", reply=200, response_json=load("project.json"))
 
 
-def _mock_mr_approvals():
-    """Mock the approvals endpoint called by MergeRequestSummary.from_gitlab."""
+def _mock_mr_approvals(required: int = 0, left: int = 0):
+    """Mock the approvals endpoint that single-MR tools attach to their summary."""
     pook.get(
         f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests/{MR_IID}/approvals",
         reply=200,
-        response_json={"approvals_required": 0, "approvals_left": 0, "approved_by": []},
+        response_json={"approvals_required": required, "approvals_left": left, "approved_by": []},
     )
 
 
@@ -55,13 +56,6 @@ def _mock_mr_list():
         reply=200,
         response_json=load("mr_list.json"),
     )
-    # list returns 2 MRs; approvals are fetched for each
-    for iid in [mr["iid"] for mr in load("mr_list.json")]:
-        pook.get(
-            f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests/{iid}/approvals",
-            reply=200,
-            response_json={"approvals_required": 0, "approvals_left": 0, "approved_by": []},
-        )
 
 
 def _mock_mr_changes():
@@ -93,6 +87,34 @@ def test_get_merge_request():
     assert result.state in ("opened", "closed", "merged", "locked")
     assert result.source_branch
     assert result.target_branch
+    assert result.head_pipeline_status == "success"
+
+
+def test_get_merge_request_attaches_approvals():
+    _mock_project()
+    _mock_mr_single()
+    _mock_mr_approvals(required=2, left=1)
+    result = get_merge_request(PROJECT_ID, MR_IID)
+    assert result.approvals == "1/2"
+    assert "1 approvals needed" in result.blockers
+
+
+def test_create_merge_request_skips_approvals():
+    """A new MR has no approvals yet, so none are fetched."""
+    pook.post(
+        f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests",
+        reply=201,
+        response_json=load("mr_single.json"),
+    )
+    approvals = pook.get(
+        f"{BASE_URL}/projects/{PROJECT_ID}/merge_requests/{MR_IID}/approvals",
+        reply=200,
+        response_json={"approvals_required": 2, "approvals_left": 2, "approved_by": []},
+    )
+    result = create_merge_request(PROJECT_ID, "feature", "main", "New feature")
+    assert result.iid == MR_IID
+    assert result.approvals == "0/0"
+    assert approvals.calls == 0
 
 
 def test_list_merge_requests():
@@ -218,6 +240,7 @@ def test_get_merge_request_approval_state():
     result = get_merge_request_approval_state(PROJECT_ID, MR_IID)
     assert result.iid == MR_IID
     assert hasattr(result, "approved")
+    assert [u.username for u in result.approved_by] == ["mwoolf"]
     assert hasattr(result, "approvals_required")
 
 
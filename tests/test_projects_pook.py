@@ -30,6 +30,19 @@ def test_get_project(mock_project):
     assert result.id == int(PROJECT_ID)
 
 
+def test_get_project_is_not_served_from_cache(gitlab_token):
+    """get_project always fetches current project details."""
+    project_mock = pook.get(
+        f"{BASE_URL}/projects/{PROJECT_ID}",
+        reply=200,
+        response_json=load("project.json"),
+        times=2,
+    )
+    get_project(PROJECT_ID)
+    get_project(PROJECT_ID)
+    assert project_mock.calls == 2
+
+
 def test_list_projects(gitlab_token):
     """Smoke test: list_projects returns a list of ProjectSummary objects."""
     pook.get(
@@ -54,7 +67,7 @@ def test_list_project_members(mock_project):
     assert isinstance(result, list)
     assert len(result) > 0
     assert hasattr(result[0], "username")
-    assert hasattr(result[0], "access_level")
+    assert result[0].access_level == "maintainer"
 
 
 def test_list_group_projects(gitlab_token):
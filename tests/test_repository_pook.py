@@ -144,7 +144,8 @@ def test_list_commits():
     assert isinstance(result, list)
     assert len(result) > 0
     assert hasattr(result[0], "sha")
-    assert hasattr(result[0], "message")
+    assert result[0].message == load("commits_list.json")[0]["title"]
+    assert "title" not in result[0].model_dump()
 
 
 def test_get_commit():
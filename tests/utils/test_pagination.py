@@ -1,7 +1,7 @@
 """Tests for pagination utilities."""
 
-from unittest.mock import Mock
-from gitlab_mcp.utils.pagination import paginate
+from unittest.mock import Mock, patch
+from gitlab_mcp.utils.pagination import paginate, paginate_json
 
 
 class TestPaginate:
@@ -102,3 +102,24 @@ class TestPaginate:
         assert result[0]["id"] == 1
         assert result[4]["id"] == 5
         manager.list.assert_called_once()
+
+
+class TestPaginateJson:
+    """Tests for the paginate_json() function."""
+
+    def test_passes_path_and_query_params(self):
+        """Test the raw path is fetched with page, per_page and filters."""
+        with patch("gitlab_mcp.utils.pagination.get_json", return_value=[{"id": 1}]) as get_json:
+            result = paginate_json("/projects/1/labels", per_page=50, page=2, search="bug")
+
+        assert result == [{"id": 1}]
+        get_json.assert_called_once_with(
+            "/projects/1/labels", {"page": 2, "per_page": 50, "search": "bug"}
+        )
+
+    def test_per_page_and_page_clamped(self):
+        """Test the same clamping as paginate()."""
+        with patch("gitlab_mcp.utils.pagination.get_json", return_value=[]) as get_json:
+            paginate_json("/projects/1/labels", per_page=500, page=0)
+
+        get_json.assert_called_once_with("/projects/1/labels", {"page": 1, "per_page": 100})